@@ -1,5 +1,6 @@
 from pages.base_page import BasePage
 from pages.sign_up_page import SignUpPage   # ✅ import your SignUp POM
+from support.snapshot import page_snapshot
 
 class Application:
     def __init__(self, driver):
@@ -13,4 +14,7 @@ class Application:
         # self.login_page = LoginPage(driver)
 
     def open(self, url: str):
-        self.driver.get(url)
\ No newline at end of file
+        self.driver.get(url)
+
+    def snapshot(self, landmarks=(), text_signs=()):
+        return page_snapshot(self.driver, landmarks, text_signs)
\ No newline at end of file
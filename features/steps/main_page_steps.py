@@ -5,6 +5,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import os
 
+from pages import locators
+from support import timeouts
+from support.routes import invalidate_route, resolve_route
+from support.snapshot import page_snapshot
+
+NOT_FOUND_SIGNS = ["404", "not found", "doesn’t exist", "does not exist", "page not found"]
+AUTH_TITLE_HINTS = ["reelly", "sign", "log in", "auth"]
+
 def _base(context) -> str:
     return (
         context.config.userdata.get("reelly_base")
@@ -13,19 +21,22 @@ def _base(context) -> str:
     ).rstrip("/")
 
 
-def _title_contains_any_ci(driver, fragments):
-    title_l = (driver.title or "").lower()
+def _title_contains_any_ci(driver, fragments, snap=None):
+    snap = snap or page_snapshot(driver)
+    title_l = (snap["title"] or "").lower()
     return any(f.lower() in title_l for f in fragments)
 
 
-def _looks_404(driver) -> bool:
-    t = (driver.title or "").lower()
-    try:
-        body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-    except Exception:
-        body_text = ""
-    signs = ["404", "not found", "doesn’t exist", "does not exist", "page not found"]
-    return any(s in t for s in signs) or any(s in body_text for s in signs)
+def _looks_404(driver, snap=None) -> bool:
+    # Body text is searched in the browser; only the matching signs come back
+    snap = snap or page_snapshot(driver, text_signs=NOT_FOUND_SIGNS)
+    t = (snap["title"] or "").lower()
+    return snap.get("status") == 404 or any(s in t for s in NOT_FOUND_SIGNS) or bool(snap["text_hits"])
+
+
+def _on_auth_page(driver) -> bool:
+    snap = page_snapshot(driver, text_signs=NOT_FOUND_SIGNS)
+    return not _looks_404(driver, snap) and _title_contains_any_ci(driver, AUTH_TITLE_HINTS, snap)
 
 
 @given("I open the Reelly sign-up page")
@@ -40,24 +51,37 @@ def open_reelly_signup(context):
         f"{base}/signup",
         f"{base}/register",
         f"{base}/auth/register",
-        f"{base}/#/auth/sign-up",  # hash router variant
+        f"{base}/#/auth/sign-up",  # hash router variant (browser only: not probed over HTTP)
     ]
+
+    # Probe the routes over plain HTTP (concurrently, cached per base) so the
+    # browser only navigates once when the winner is already known.
+    tried = None
+    if str(context.config.userdata.get("route_probe", "true")).lower() != "false":
+        tried = resolve_route(base, directs)
+        if tried:
+            d.get(tried)
+            if _on_auth_page(d):
+                return
+            invalidate_route(base)
+
     for url in directs:
+        if url == tried:
+            continue
         d.get(url)
         WebDriverWait(d, 5).until(lambda x: True)
-        if not _looks_404(d) and _title_contains_any_ci(d, ["reelly", "sign", "log in", "auth"]):
+        if _on_auth_page(d):
             return
 
     # Fallback: open home and click a link
     d.get(base)
-    WebDriverWait(d, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-    link_texts = ["Sign up", "Create account", "Register", "Get started", "Join now", "Sign Up"]
-    for text in link_texts:
+    timeouts.until(d, "main_page", "home_body", EC.presence_of_element_located((By.TAG_NAME, "body")), 10)
+    for locator in locators.get("main_page", "signup_link"):
         try:
-            el = d.find_element(By.PARTIAL_LINK_TEXT, text)
+            el = d.find_element(*locator)
             d.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-            WebDriverWait(d, 5).until(EC.element_to_be_clickable(el)).click()
-            WebDriverWait(d, 5).until(lambda x: _title_contains_any_ci(d, ["reelly", "sign", "log in", "auth"]))
+            timeouts.until(d, "main_page", "signup_link:clickable", EC.element_to_be_clickable(el), 5).click()
+            timeouts.until(d, "main_page", "auth_title", lambda x: _title_contains_any_ci(d, AUTH_TITLE_HINTS), 5)
             return
         except Exception:
             continue
@@ -74,5 +98,5 @@ def open_reelly_signup(context):
 
 @then('The page title should contain "Reelly"')
 def title_should_contain_reelly(context):
-    ok = _title_contains_any_ci(context.driver, ["reelly", "sign", "log in", "auth"])
+    ok = _title_contains_any_ci(context.driver, AUTH_TITLE_HINTS)
     assert ok, f"Unexpected title: {context.driver.title}"
\ No newline at end of file
@@ -1,37 +1,30 @@
 # features/steps/product_search.py
 from behave import given, when, then
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from pages import locators
+from support import timeouts
+from support.snapshot import page_snapshot
+from support.waits import wait_any
 
 DEFAULT_TIMEOUT = 25
-GOOGLE_HOME = "https://www.google.com/?hl=en&gl=us"
+CONSENT_TIMEOUT = 5
+GOOGLE_BASE = "https://www.google.com"
 QUERY = "Car"
 
-# ---------- Candidate locators ----------
-SEARCH_INPUT_CANDS = [
-    (By.NAME, "q"),
-    (By.CSS_SELECTOR, 'input[title="Search"]'),
-    (By.CSS_SELECTOR, 'form[action*="/search"] input[type="text"]'),
-]
-
-SEARCH_SUBMIT_CANDS = [
-    (By.NAME, "btnK"),
-    (By.CSS_SELECTOR, 'input[name="btnK"]'),
-    (By.CSS_SELECTOR, 'form[action*="/search"] button[type="submit"]'),
-]
-
-# Results containers / items (mobile+desktop)
-RESULTS_READY_CANDS = [
-    (By.ID, "search"),
-    (By.CSS_SELECTOR, "#center_col"),
-    (By.CSS_SELECTOR, 'div[role="main"]'),
-    (By.CSS_SELECTOR, 'a h3'),              # result titles
-    (By.CSS_SELECTOR, 'div[data-hveid]'),   # result blocks
-]
+# ---------- Candidate locators (pages/locators.py) ----------
+SEARCH_INPUT_CANDS = locators.get("google", "search_input")
+SEARCH_SUBMIT_CANDS = locators.get("google", "search_submit")
+RESULTS_READY_CANDS = locators.get("google", "results_ready")
+CONSENT_IFRAME_CANDS = locators.get("google", "consent_iframe")
+CONSENT_CANDS = locators.get("google", "consent_accept")
 
 # ---------- Helpers ----------
+def _google_base(context):
+    # -D google_base=... points the feature at a stand-in (see support.fixture_server)
+    ud = getattr(context.config, "userdata", {})
+    return (ud.get("google_base") or GOOGLE_BASE).rstrip("/")
+
 def _effective_timeout(context):
     ud = getattr(context.config, "userdata", {})
     on_bs = str(ud.get("provider", "")).lower() in ("browserstack", "bs", "remote")
@@ -40,49 +33,28 @@ def _effective_timeout(context):
         return max(DEFAULT_TIMEOUT, 90)
     return DEFAULT_TIMEOUT
 
-def _wait_any_present(context, candidates, timeout):
-    wait = WebDriverWait(context.driver, timeout)
-    last_err = None
-    for loc in candidates:
-        try:
-            return wait.until(EC.presence_of_element_located(loc))
-        except Exception as e:
-            last_err = e
-    if last_err:
-        raise last_err
-    raise TimeoutError("No locator matched (present).")
-
-def _wait_any_visible(context, candidates, timeout):
-    wait = WebDriverWait(context.driver, timeout)
-    last_err = None
-    for loc in candidates:
-        try:
-            return wait.until(EC.visibility_of_element_located(loc))
-        except Exception as e:
-            last_err = e
-    if last_err:
-        raise last_err
-    raise TimeoutError("No locator matched (visible).")
+def _wait_any_present(context, candidates, timeout, field=None):
+    key = ("product_search", field) if field else None
+    el, _ = wait_any(context.driver, candidates, "present", timeout, key=key)
+    return el
+
+def _wait_any_visible(context, candidates, timeout, field=None):
+    key = ("product_search", field) if field else None
+    el, _ = wait_any(context.driver, candidates, "visible", timeout, key=key)
+    return el
 
 def _maybe_accept_google_consent(context):
     d = context.driver
     try:
         # Consent sometimes appears in an iframe
-        iframes = d.find_elements(By.CSS_SELECTOR, 'iframe[src*="consent"]')
+        iframes = d.find_elements(*CONSENT_IFRAME_CANDS[0])
         if iframes:
             d.switch_to.frame(iframes[0])
-        CONSENT_CANDS = [
-            (By.ID, "L2AGLb"),
-            (By.CSS_SELECTOR, 'button[aria-label*="Accept"]'),
-            (By.XPATH, '//button[contains(.,"I agree") or contains(.,"Accept all")]'),
-        ]
-        for loc in CONSENT_CANDS:
-            try:
-                btn = WebDriverWait(d, 5).until(EC.element_to_be_clickable(loc))
-                btn.click()
-                break
-            except Exception:
-                continue
+        try:
+            btn, _ = wait_any(d, CONSENT_CANDS, "clickable", CONSENT_TIMEOUT, key=("product_search", "consent"))
+            btn.click()
+        except Exception:
+            pass
     except Exception:
         pass
     finally:
@@ -91,44 +63,48 @@ def _maybe_accept_google_consent(context):
         except Exception:
             pass
 
-def _url_has_query(d):
-    url = (d.current_url or "").lower()
+def _url_has_query(d, snap=None):
+    url = ((snap or page_snapshot(d))["url"] or "").lower()
     return "/search" in url and "q=car" in url
 
-def _title_has_query(d):
-    return QUERY.lower() in (d.title or "").lower()
+def _title_has_query(d, snap=None):
+    return QUERY.lower() in ((snap or page_snapshot(d))["title"] or "").lower()
+
+def _query_in_url_or_title(d):
+    # One snapshot per poll covers both URL and title signals
+    snap = page_snapshot(d)
+    return _url_has_query(d, snap) or _title_has_query(d, snap)
 
 def _results_look_loaded(context, timeout):
-    d = context.driver
-    wait = WebDriverWait(d, timeout)
-    # Any of these being true is “success”
-    try:
-        if _url_has_query(d):
-            return True
-    except Exception:
-        pass
+    # Any of these being true is “success”; all are checked on every poll
+    signals = [_query_in_url_or_title, *RESULTS_READY_CANDS]
     try:
-        _wait_any_present(context, RESULTS_READY_CANDS, min(20, timeout))
+        wait_any(context.driver, signals, "present", min(20, timeout),
+                 key=("product_search", "results_ready"))
         return True
     except Exception:
-        pass
-    try:
-        if _title_has_query(d):
-            return True
-    except Exception:
-        pass
-    return False
+        return False
 
 # ---------- Steps ----------
 @given("Open Google page")
 def open_google(context):
-    context.driver.get(GOOGLE_HOME)
-    _maybe_accept_google_consent(context)
+    base = _google_base(context)
+    consent = getattr(context, "consent", None)  # support.consent, set in before_all
+    if consent:
+        consent.prepare(context.driver, base)
+    context.driver.get(f"{base}/?hl=en&gl=us")
+    if consent:
+        # Click flow only when a banner is actually on the page
+        fallback = timeouts.timeout_for("product_search", "consent:clickable", CONSENT_TIMEOUT)
+        consent.handle(context.driver, base, CONSENT_IFRAME_CANDS + CONSENT_CANDS,
+                       lambda: _maybe_accept_google_consent(context), fallback)
+    else:
+        _maybe_accept_google_consent(context)
 
 @when("Input Car into search field")
 def type_query(context):
     timeout = _effective_timeout(context)
-    input_el = _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout)
+    input_el = _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout, "search_input")
     try:
         input_el.clear()
     except Exception:
@@ -142,20 +118,20 @@ def submit_search(context):
 
     # ENTER tends to be most reliable on mobile Safari
     try:
-        _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout).send_keys(Keys.ENTER)
+        _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout, "search_input").send_keys(Keys.ENTER)
         return
     except Exception:
         pass
 
     # Fallback: click a submit button if visible
     try:
-        _wait_any_visible(context, SEARCH_SUBMIT_CANDS, timeout).click()
+        _wait_any_visible(context, SEARCH_SUBMIT_CANDS, timeout, "search_submit").click()
         return
     except Exception:
         pass
 
     # Last resort: send ENTER again
-    _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout).send_keys(Keys.ENTER)
+    _wait_any_visible(context, SEARCH_INPUT_CANDS, timeout, "search_input").send_keys(Keys.ENTER)
 
 @then("Product results for Car are shown")
 def verify_results(context):
@@ -167,7 +143,7 @@ def verify_results(context):
         return
 
     # ---- Forced navigation fallback (for flaky iOS Safari/Appium cases) ----
-    forced_url = f"https://www.google.com/search?q={QUERY}&hl=en&gl=us"
+    forced_url = f"{_google_base(context)}/search?q={QUERY}&hl=en&gl=us"
     d.get(forced_url)
 
     if _results_look_loaded(context, timeout):
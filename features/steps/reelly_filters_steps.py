@@ -1,8 +1,16 @@
+import time
 from behave import given, then
 from urllib.parse import urlparse, parse_qs
-from selenium.webdriver.support.ui import WebDriverWait
+
+from support.cache import is_fresh, load_json, save_json
+from support.waits import wait_url
 
 DEFAULT_TIMEOUT = 25
+# Per provider: which filters URL kept its params last time, which redirected to sign-in
+FILTER_HOSTS_FILE = "filter_hosts.json"
+FILTER_HOSTS_TTL = 24 * 3600
+FIND_BASE = "https://find.reelly.io"
+SOFT_BASE = "https://soft.reelly.io"
 
 # Expected query parameters
 EXPECTED = {
@@ -21,26 +29,66 @@ def _userdata(context, key, default=None):
     return ud.get(key, None) or default
 
 
+def _hosts(context):
+    # -D find_base / soft_base override the public and soft hosts (e.g. local fixtures)
+    find = (_userdata(context, "find_base", FIND_BASE)).rstrip("/")
+    soft = (_userdata(context, "soft_base", SOFT_BASE)).rstrip("/")
+    return find, soft
+
+
+def _on_app_host(context, url) -> bool:
+    netloc = urlparse(url).netloc
+    return "reelly.io" in netloc or netloc in {urlparse(h).netloc for h in _hosts(context)}
+
+
 def _is_remote(context) -> bool:
     provider = str(_userdata(context, "provider", "")).lower()
     return provider in ("browserstack", "bs", "remote")
 
 
-def _wait_query_keys(context, timeout=DEFAULT_TIMEOUT) -> bool:
-    d = context.driver
+def _provider(context) -> str:
+    return (str(_userdata(context, "provider", "")) or "local").lower()
+
 
-    def has_expected():
-        cur = d.current_url
-        qs = parse_qs(urlparse(cur).query or "")
-        return all(k in qs for k in EXPECTED.keys())
+def _host_memory(context) -> dict:
+    entry = load_json(FILTER_HOSTS_FILE).get(_provider(context)) or {}
+    return entry if is_fresh(entry, FILTER_HOSTS_TTL) else {}
 
+
+def _remember_hosts(context, winner=None, signin=()):
+    if getattr(context.driver, "http_tier", False):
+        # urllib runs no JS: a host that "kept the params" here may still bounce in a browser
+        return
+    data = load_json(FILTER_HOSTS_FILE)
+    entry = _host_memory(context) or {"signin": []}
+    if winner:
+        entry["winner"] = winner
+    elif entry.get("winner") in signin:
+        entry.pop("winner")  # last winner now bounces to sign-in
+    entry["signin"] = sorted((set(entry.get("signin", [])) | set(signin)) - {winner})
+    entry["ts"] = time.time()
+    data[_provider(context)] = entry
+    save_json(FILTER_HOSTS_FILE, data)
+
+
+def _order_candidates(context, candidates):
+    """Last winner first; URLs known to bounce to sign-in go last."""
+    mem = _host_memory(context)
+    signin = set(mem.get("signin", []))
+    first = [mem["winner"]] if mem.get("winner") in candidates else []
+    rest = [c for c in candidates if c not in first]
+    return first + [c for c in rest if c not in signin] + [c for c in rest if c in signin]
+
+
+def _wait_query_keys(context, timeout=DEFAULT_TIMEOUT) -> bool:
+    d = context.driver
     try:
-        WebDriverWait(d, timeout).until(lambda _:
-            "reelly.io" in urlparse(d.current_url).netloc and has_expected()
-        )
-        return True
+        # Adaptive timeout; event-driven in -D wait_mode=event, polling otherwise
+        url = wait_url(d, [f"{k}=" for k in EXPECTED], timeout, key=("reelly_filters", "query_keys"))
     except Exception:
         return False
+    qs = parse_qs(urlparse(url).query or "")
+    return _on_app_host(context, url) and all(k in qs for k in EXPECTED.keys())
 
 
 def _open_and_wait(context, url: str) -> str:
@@ -61,10 +109,11 @@ def _open_filters_resilient(context) -> str:
     remote = _is_remote(context)
 
     # Preferred targets
-    public_root = f"https://find.reelly.io/?{FILTER_QUERY}"
-    public_find = f"https://find.reelly.io/find?{FILTER_QUERY}"
-    soft_root = f"https://soft.reelly.io/?{FILTER_QUERY}"
-    soft_find = f"https://soft.reelly.io/find?{FILTER_QUERY}"
+    find_base, soft_base = _hosts(context)
+    public_root = f"{find_base}/?{FILTER_QUERY}"
+    public_find = f"{find_base}/find?{FILTER_QUERY}"
+    soft_root = f"{soft_base}/?{FILTER_QUERY}"
+    soft_find = f"{soft_base}/find?{FILTER_QUERY}"
 
     candidates = []
     if remote:
@@ -73,16 +122,22 @@ def _open_filters_resilient(context) -> str:
     else:
         # Local prefers soft/find
         candidates = [soft_find, soft_root, public_root, public_find]
+    candidates = _order_candidates(context, candidates)
 
     d = context.driver
     last_url = None
+    redirected = []
     for target in candidates:
         last_url = _open_and_wait(context, target)
         # Success path: we are not on sign-in and we have keys
         if "sign-in" not in last_url:
             qs = parse_qs(urlparse(last_url).query or "")
             if all(k in qs for k in EXPECTED.keys()):
+                _remember_hosts(context, winner=target, signin=redirected)
                 return last_url
+        else:
+            redirected.append(target)
+    _remember_hosts(context, signin=redirected)
 
     # If we’re here, we couldn’t keep the params.
     # On BrowserStack, treat sign-in redirects as environment constraint and allow soft assertion.
@@ -97,12 +152,18 @@ def _open_filters_resilient(context) -> str:
 
 @given("I open the Reelly find page with filters URL")
 def open_find_with_filters(context):
-    _open_filters_resilient(context)
+    # Scenario-scoped: the Then step checks this navigation instead of redoing it
+    context.filters_url = _open_filters_resilient(context)
 
 
 @then("The current URL should include the expected filter params")
 def verify_params(context):
-    final_url = _open_filters_resilient(context)
+    if getattr(context, "filters_url", None):
+        # Where the Given landed. In the browser current_url also catches a later
+        # client-side redirect; HttpDriver hands such pages to the browser instead.
+        final_url = context.driver.current_url
+    else:
+        final_url = _open_filters_resilient(context)
 
     # If remote and we are on sign-in, relax (informational pass)
     if _is_remote(context) and "sign-in" in final_url:
@@ -1,3 +1,5 @@
+import os
+
 from behave import when, then
 
 FULL_NAME = "test+ozan careerist"
@@ -5,6 +7,13 @@ PHONE     = "+971555123456"
 EMAIL     = "test.ozan.careerist+qa@example.com"
 PASSWORD  = "TestPassword!123"
 
+
+def _bulk(context) -> bool:
+    # -D fill_mode=bulk (or FILL_MODE=bulk): set/read all fields in one script call each
+    ud = getattr(context.config, "userdata", {})
+    return str(ud.get("fill_mode", os.getenv("FILL_MODE", ""))).lower() == "bulk"
+
+
 @when("I fill the registration form with valid test data")
 def fill_form(context):
     # Use the POM
@@ -12,7 +21,8 @@ def fill_form(context):
         full_name=FULL_NAME,
         phone=PHONE,
         email=EMAIL,
-        password=PASSWORD
+        password=PASSWORD,
+        bulk=_bulk(context),
     )
 
 @then("Each registration field shows the entered value")
@@ -21,5 +31,6 @@ def verify_values(context):
         full_name=FULL_NAME,
         phone_part="+971",
         email=EMAIL,
-        password=PASSWORD
+        password=PASSWORD,
+        bulk=_bulk(context),
     )
\ No newline at end of file
@@ -1,24 +1,42 @@
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from support.snapshot import page_snapshot
+from support.waits import wait_any
 
 DEFAULT_TIMEOUT = 10
 
 class BasePage:
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+        self.wait = WebDriverWait(driver, self.DEFAULT_TIMEOUT)
 
     def open_url(self, url: str):
         self.driver.get(url)
 
+    # Single-locator waits go through wait_any so they share adaptive
+    # timeouts and the event-driven wait mode.
     def click(self, locator):
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        self.wait_any([locator], "clickable", field=f"{locator[0]}={locator[1]}")[0].click()
 
     def type(self, locator, text: str, clear: bool = True):
-        el = self.wait.until(EC.visibility_of_element_located(locator))
+        el, _ = self.wait_any([locator], "visible", field=f"{locator[0]}={locator[1]}")
         if clear:
             el.clear()
         el.send_keys(text)
 
     def wait_visible(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
\ No newline at end of file
+        return self.wait_any([locator], "visible", field=f"{locator[0]}={locator[1]}")[0]
+
+    def wait_any(self, candidates, condition="visible", timeout=None, field=None):
+        """First candidate to match under one deadline -> (element, locator).
+
+        With `field`, candidate order is learned per page/field across runs.
+        """
+        key = (type(self).__name__, field) if field else None
+        return wait_any(self.driver, candidates, condition, timeout or self.DEFAULT_TIMEOUT, key=key)
+
+    def snapshot(self, landmarks=(), text_signs=()):
+        """URL/title/readyState/status/landmarks in one round trip (see support.snapshot)."""
+        return page_snapshot(self.driver, landmarks, text_signs)
\ No newline at end of file
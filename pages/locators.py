@@ -0,0 +1,183 @@
+"""
+Central locator registry.
+
+Every page object and step module takes its (fallback) locators from here, so
+one file describes the UI we depend on. Candidates are listed in preference
+order; support.locator_stats may reorder them at runtime.
+
+combined_css() (from support.js_locators, re-exported here) folds
+CSS-expressible fallbacks into one selector list, which the wait engine uses
+as a single-query gate per poll.
+
+Offline validation against saved HTML (needs `pip install lxml cssselect`):
+
+    python -m pages.locators validate snapshots/
+    python -m pages.locators export-fixtures snapshots/   # stand-in pages
+
+Snapshot files are matched to registry pages by name prefix, e.g.
+snapshots/sign_up.html, snapshots/google-home.html, snapshots/google-results.html.
+Registry pages without a snapshot are reported as unchecked.
+"""
+import sys
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+# Pure selector helpers live in support; re-exported for callers of pages.locators
+from support.js_locators import combined_css, css_of
+
+LOCATORS = {
+    "sign_up": {
+        "full_name": [
+            (By.ID, "Full-Name"),
+            (By.CSS_SELECTOR, 'input[wizde="fullNameInput"]'),
+            (By.CSS_SELECTOR, 'input[data-name="Full-Name"]'),
+            (By.XPATH, '//input[contains(@placeholder, "Full") or contains(@aria-label, "Full")]'),
+        ],
+        "phone": [
+            (By.ID, "phone2"),
+            (By.CSS_SELECTOR, 'input[wizde="phoneInput"]'),
+            (By.XPATH, '//input[contains(@placeholder,"Phone")]'),
+        ],
+        "email": [
+            (By.ID, "Email-3"),
+            (By.XPATH, '//input[contains(@type,"email") or contains(@placeholder,"Email")]'),
+        ],
+        "password": [
+            (By.CSS_SELECTOR, 'input[wizde="passwordInput"]'),
+            (By.ID, "field"),
+            (By.CSS_SELECTOR, 'input[type="password"]'),
+        ],
+    },
+    "sign_in": {
+        "create_account_link": [
+            (By.XPATH, '//a[contains(@href,"sign-up")]'),
+            (By.XPATH, '//*[self::a or self::button][contains(normalize-space(.), "Create account")]'),
+        ],
+    },
+    "main_page": {
+        "signup_link": [
+            (By.PARTIAL_LINK_TEXT, text)
+            for text in ["Sign up", "Create account", "Register", "Get started", "Join now", "Sign Up"]
+        ],
+    },
+    "google": {
+        "search_input": [
+            (By.NAME, "q"),
+            (By.CSS_SELECTOR, 'input[title="Search"]'),
+            (By.CSS_SELECTOR, 'form[action*="/search"] input[type="text"]'),
+        ],
+        "search_submit": [
+            (By.NAME, "btnK"),
+            (By.CSS_SELECTOR, 'input[name="btnK"]'),
+            (By.CSS_SELECTOR, 'form[action*="/search"] button[type="submit"]'),
+        ],
+        # Results containers / items (mobile+desktop)
+        "results_ready": [
+            (By.ID, "search"),
+            (By.CSS_SELECTOR, "#center_col"),
+            (By.CSS_SELECTOR, 'div[role="main"]'),
+            (By.CSS_SELECTOR, 'a h3'),              # result titles
+            (By.CSS_SELECTOR, 'div[data-hveid]'),   # result blocks
+        ],
+        "consent_iframe": [
+            (By.CSS_SELECTOR, 'iframe[src*="consent"]'),
+        ],
+        "consent_accept": [
+            (By.ID, "L2AGLb"),
+            (By.CSS_SELECTOR, 'button[aria-label*="Accept"]'),
+            (By.XPATH, '//button[contains(.,"I agree") or contains(.,"Accept all")]'),
+        ],
+    },
+}
+
+# Fields that are legitimately absent from some snapshots (banner only sometimes shown)
+OPTIONAL = {("google", "consent_iframe"), ("google", "consent_accept")}
+
+
+def get(page, field):
+    return list(LOCATORS[page][field])
+
+
+# ---------------- Offline validation ----------------
+
+def _xpath_of(locator):
+    by, sel = locator
+    if by == By.XPATH:
+        return sel
+    if by == By.LINK_TEXT:
+        return f'//a[normalize-space(.)="{sel}"]'
+    if by == By.PARTIAL_LINK_TEXT:
+        return f'//a[contains(normalize-space(.), "{sel}")]'
+    from cssselect import GenericTranslator
+    return GenericTranslator().css_to_xpath(css_of(locator))
+
+
+def validate(snapshot_dir):
+    """{(page, field): {candidate: hits}} over snapshots named <page>*.html."""
+    try:
+        from lxml import html as lxml_html
+    except ImportError:
+        raise SystemExit("Offline validation needs: pip install lxml cssselect")
+
+    docs = {}
+    for f in sorted(Path(snapshot_dir).glob("*.html")):
+        page = next((p for p in LOCATORS if f.stem.replace("-", "_").startswith(p)), None)
+        if page:
+            docs.setdefault(page, []).append(lxml_html.fromstring(f.read_bytes()))
+
+    results = {}
+    for page, trees in docs.items():
+        for field, cands in LOCATORS[page].items():
+            results[(page, field)] = {
+                c: sum(len(t.xpath(_xpath_of(c))) for t in trees) for c in cands
+            }
+    return results
+
+
+def export_fixtures(out_dir):
+    """Write the fixture server's stand-in pages as snapshots."""
+    from support.fixture_server import (
+        FixtureConfig, find_html, google_home_html, google_results_html, signin_html, signup_html,
+    )
+    cfg = FixtureConfig(consent_banner=True)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    pages = {
+        "sign_up.html": signup_html(cfg),
+        "sign_in.html": signin_html(),
+        "main_page.html": find_html(),
+        "google-home.html": google_home_html(cfg),
+        "google-results.html": google_results_html("Car"),
+    }
+    for name, body in pages.items():
+        (out / name).write_text(body, encoding="utf-8")
+    return sorted(pages)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if len(argv) != 2 or argv[0] not in ("validate", "export-fixtures"):
+        print("usage: python -m pages.locators [validate|export-fixtures] <dir>")
+        return 2
+    if argv[0] == "export-fixtures":
+        print("\n".join(export_fixtures(argv[1])))
+        return 0
+
+    dead_fields = 0
+    results = validate(argv[1])
+    for (page, field), hits in results.items():
+        alive = [c for c, n in hits.items() if n]
+        status = "ok" if alive else ("optional" if (page, field) in OPTIONAL else "DEAD")
+        dead_fields += status == "DEAD"
+        print(f"[{status:>8}] {page}.{field}")
+        for cand, n in hits.items():
+            print(f"           {'x' if n else '-'} {n:3d}  {cand[0]}={cand[1]}")
+    unchecked = [p for p in LOCATORS if not any(page == p for page, _ in results)]
+    for page in unchecked:
+        print(f"[unchecked] {page}: no {page}*.html snapshot ({len(LOCATORS[page])} fields)")
+    return 1 if dead_fields else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
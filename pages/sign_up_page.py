@@ -1,61 +1,66 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages import locators
+from pages.base_page import BasePage
+from support import locator_stats
+from support.js_locators import FIND_JS, to_js
 
 DEFAULT_TIMEOUT = 15
 
 
-class SignUpPage:
-    # --------- Locators (with fallbacks) ----------
-    FULL_NAME_CANDS = [
-        (By.ID, "Full-Name"),
-        (By.CSS_SELECTOR, 'input[wizde="fullNameInput"]'),
-        (By.CSS_SELECTOR, 'input[data-name="Full-Name"]'),
-        (By.XPATH, '//input[contains(@placeholder, "Full") or contains(@aria-label, "Full")]'),
-    ]
-
-    PHONE_CANDS = [
-        (By.ID, "phone2"),
-        (By.CSS_SELECTOR, 'input[wizde="phoneInput"]'),
-        (By.XPATH, '//input[contains(@placeholder,"Phone")]'),
-    ]
-
-    EMAIL_CANDS = [
-        (By.ID, "Email-3"),
-        (By.XPATH, '//input[contains(@type,"email") or contains(@placeholder,"Email")]'),
-    ]
-
-    PASSWORD_CANDS = [
-        (By.CSS_SELECTOR, 'input[wizde="passwordInput"]'),
-        (By.ID, "field"),
-        (By.CSS_SELECTOR, 'input[type="password"]'),
-    ]
-
-    CREATE_ACCOUNT_LINK_CANDS = [
-        (By.XPATH, '//a[contains(@href,"sign-up")]'),
-        (By.XPATH, '//*[self::a or self::button][contains(normalize-space(.), "Create account")]'),
-    ]
+class SignUpPage(BasePage):
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+
+    # --------- Locators (with fallbacks, see pages/locators.py) ----------
+    FULL_NAME_CANDS = locators.get("sign_up", "full_name")
+    PHONE_CANDS = locators.get("sign_up", "phone")
+    EMAIL_CANDS = locators.get("sign_up", "email")
+    PASSWORD_CANDS = locators.get("sign_up", "password")
+    CREATE_ACCOUNT_LINK_CANDS = locators.get("sign_in", "create_account_link")
 
     SIGNUP_LANDMARK_CANDS = FULL_NAME_CANDS  # name field signals we're on sign-up
 
-    def __init__(self, driver):
-        self.driver = driver
+    FORM_FIELDS = {
+        "full_name": FULL_NAME_CANDS,
+        "phone": PHONE_CANDS,
+        "email": EMAIL_CANDS,
+        "password": PASSWORD_CANDS,
+    }
+
+    # Resolve + set every field in one round trip. Uses the native value
+    # setter so React/Webflow-style inputs see the change, then fires events.
+    BULK_FILL_JS = FIND_JS + """
+    var fields = arguments[0], done = {};
+    for (var i = 0; i < fields.length; i++) {
+      var f = fields[i], hit = __findAny(f.cands, true);
+      if (!hit) { done[f.name] = false; continue; }
+      var el = hit.el, proto = Object.getPrototypeOf(el);
+      var desc = Object.getOwnPropertyDescriptor(proto, 'value');
+      el.focus();
+      if (desc && desc.set) desc.set.call(el, f.value); else el.value = f.value;
+      el.dispatchEvent(new Event('input', {bubbles: true}));
+      el.dispatchEvent(new Event('change', {bubbles: true}));
+      el.blur();
+      done[f.name] = true;
+    }
+    return done;
+    """
+
+    BULK_READ_JS = FIND_JS + """
+    var fields = arguments[0], out = {};
+    for (var i = 0; i < fields.length; i++) {
+      var hit = __findAny(fields[i].cands, true);
+      out[fields[i].name] = hit ? (hit.el.value || "") : null;
+    }
+    return out;
+    """
 
     # ---------- small helpers ----------
-    def _wait_any_visible(self, candidates, timeout=DEFAULT_TIMEOUT):
-        d = self.driver
-        last_err = None
-        for by, sel in candidates:
-            try:
-                return WebDriverWait(d, timeout).until(
-                    EC.visibility_of_element_located((by, sel))
-                )
-            except Exception as e:
-                last_err = e
-        raise last_err or TimeoutError("No candidate locator became visible")
-
-    def _type(self, candidates, text, clear=True):
-        el = self._wait_any_visible(candidates)
+    def _wait_any_visible(self, candidates, timeout=DEFAULT_TIMEOUT, field=None):
+        # All candidates share one deadline (not timeout per candidate)
+        el, _ = self.wait_any(candidates, "visible", timeout, field=field)
+        return el
+
+    def _type(self, candidates, text, clear=True, field=None):
+        el = self._wait_any_visible(candidates, field=field)
         try:
             if clear:
                 el.clear()
@@ -63,39 +68,77 @@ class SignUpPage:
             pass
         el.send_keys(text)
 
-    def _value(self, candidates):
-        el = self._wait_any_visible(candidates)
+    def _value(self, candidates, field=None):
+        el = self._wait_any_visible(candidates, field=field)
         return el.get_attribute("value") or ""
 
+    def _bulk_fields(self, names):
+        # Same learned order as the per-field path
+        page = type(self).__name__
+        return [
+            {"name": n, "cands": to_js(locator_stats.rank(page, n, self.FORM_FIELDS[n]))}
+            for n in names
+        ]
+
+    # ---------- bulk mode (one script call each way) ----------
+    def bulk_fill(self, values: dict) -> list:
+        """Set all fields in one execute_script; returns names it could not resolve."""
+        fields = self._bulk_fields(values)
+        for f in fields:
+            f["value"] = values[f["name"]]
+        try:
+            done = self.driver.execute_script(self.BULK_FILL_JS, fields) or {}
+        except Exception:
+            done = {}
+        return [n for n in values if not done.get(n)]
+
+    def read_values(self, bulk=True) -> dict:
+        """{field: value} for every form field; one round trip in bulk mode."""
+        if bulk:
+            try:
+                got = self.driver.execute_script(self.BULK_READ_JS, self._bulk_fields(self.FORM_FIELDS)) or {}
+            except Exception:
+                got = {}
+            missing = [n for n in self.FORM_FIELDS if got.get(n) is None]
+        else:
+            got, missing = {}, list(self.FORM_FIELDS)
+        for name in missing:
+            got[name] = self._value(self.FORM_FIELDS[name], name)
+        return got
+
     # ---------- navigation guard ----------
     def ensure_on_signup(self):
         url = self.driver.current_url
         if "sign-in" in url:
-            for cand in self.CREATE_ACCOUNT_LINK_CANDS:
-                try:
-                    WebDriverWait(self.driver, DEFAULT_TIMEOUT).until(
-                        EC.element_to_be_clickable(cand)
-                    ).click()
-                    break
-                except Exception:
-                    continue
+            try:
+                el, _ = self.wait_any(self.CREATE_ACCOUNT_LINK_CANDS, "clickable", field="create_account")
+                el.click()
+            except Exception:
+                pass
         # Wait for landmark
-        self._wait_any_visible(self.SIGNUP_LANDMARK_CANDS)
+        self._wait_any_visible(self.SIGNUP_LANDMARK_CANDS, field="full_name")
 
     # ---------- actions ----------
-    def fill_form(self, full_name, phone, email, password):
+    def fill_form(self, full_name, phone, email, password, bulk=False):
+        """bulk=True sets values via script; default keeps real per-key typing."""
         self.ensure_on_signup()
-        self._type(self.FULL_NAME_CANDS, full_name)
-        self._type(self.PHONE_CANDS, phone)
-        self._type(self.EMAIL_CANDS, email)
-        self._type(self.PASSWORD_CANDS, password)
+        if bulk:
+            values = {"full_name": full_name, "phone": phone, "email": email, "password": password}
+            for name in self.bulk_fill(values):
+                self._type(self.FORM_FIELDS[name], values[name], field=name)
+            return
+        self._type(self.FULL_NAME_CANDS, full_name, field="full_name")
+        self._type(self.PHONE_CANDS, phone, field="phone")
+        self._type(self.EMAIL_CANDS, email, field="email")
+        self._type(self.PASSWORD_CANDS, password, field="password")
 
     # ---------- assertions ----------
-    def assert_form_values(self, full_name, phone_part, email, password):
-        assert self._value(self.FULL_NAME_CANDS) == full_name, "Full name mismatch"
-        assert phone_part in self._value(self.PHONE_CANDS), f"Phone does not contain {phone_part}"
-        assert self._value(self.EMAIL_CANDS) == email, "Email mismatch"
+    def assert_form_values(self, full_name, phone_part, email, password, bulk=False):
+        values = self.read_values(bulk=bulk)
+        assert values["full_name"] == full_name, "Full name mismatch"
+        assert phone_part in values["phone"], f"Phone does not contain {phone_part}"
+        assert values["email"] == email, "Email mismatch"
 
-        pwd_val = self._value(self.PASSWORD_CANDS)
+        pwd_val = values["password"]
         # some envs mask passwords; accept exact or same length
         assert pwd_val == password or len(pwd_val) == len(password), "Password value mismatch"
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Non-blocking failure artifacts.
+
+after_step only grabs the screenshot bytes (and optionally the DOM) from the
+driver; disk writes happen on a background thread behind a bounded queue, so
+the next step/scenario doesn't wait on file I/O.
+
+- PNG bytes are stored as-is (already deflate-compressed); DOM snapshots are
+  gzipped.
+- The directory is kept under a byte budget: oldest artifacts (including ones
+  from earlier runs) are deleted first.
+- When the queue is full the artifact is dropped and counted rather than
+  blocking the test.
+- Allure attachments are made from the in-memory bytes on the caller's thread
+  (allure-behave tracks the current test per thread).
+
+flush() in after_all drains the queue.
+"""
+import gzip
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_DIR = "screenshots"
+DEFAULT_BUDGET_MB = 200
+DEFAULT_QUEUE = 16
+
+
+def safe_name(name, limit=80):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)[:limit]
+
+
+def allure_attach(body, name, kind="png"):
+    """Best-effort Allure attachment from bytes/str (no-op without allure)."""
+    try:
+        from allure_commons.types import AttachmentType
+        from allure_commons._allure import attach
+        attachment_type = AttachmentType.PNG if kind == "png" else AttachmentType.HTML
+        attach(body, name=name, attachment_type=attachment_type)
+    except Exception:
+        pass
+
+
+class ArtifactWriter:
+    def __init__(self, out_dir=DEFAULT_DIR, budget_mb=DEFAULT_BUDGET_MB, max_queue=DEFAULT_QUEUE):
+        self.out_dir = Path(out_dir)
+        self.budget = int(float(budget_mb) * 1024 * 1024)
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.evicted = 0
+        self._files = []   # (path, size), oldest first
+        self._total = 0
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._started = False
+
+    def _scan(self):
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            existing = sorted(
+                (p for p in self.out_dir.iterdir() if p.is_file()),
+                key=lambda p: p.stat().st_mtime,
+            )
+            self._files = [(p, p.stat().st_size) for p in existing]
+            self._total = sum(size for _, size in self._files)
+        except Exception:
+            self._files, self._total = [], 0
+
+    def start(self):
+        if not self._started:
+            self._scan()
+            self._thread.start()
+            self._started = True
+        return self
+
+    # ---- producer side (test thread) ----
+    def submit(self, name, png=None, dom=None):
+        """Queue bytes for writing; returns False if the queue was full."""
+        if png is None and dom is None:
+            return False
+        ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+        item = (f"{ts}-{safe_name(name)}", png, dom)
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    # ---- consumer side (writer thread) ----
+    def _store(self, path, data):
+        if len(data) > self.budget:
+            self.dropped += 1
+            return
+        while self._files and self._total + len(data) > self.budget:
+            old, size = self._files.pop(0)
+            try:
+                old.unlink()
+                self.evicted += 1
+            except Exception:
+                pass
+            self._total -= size
+        path.write_bytes(data)
+        self._files.append((path, len(data)))
+        self._total += len(data)
+        self.written += 1
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                base, png, dom = item
+                if png:
+                    self._store(self.out_dir / f"{base}.png", png)
+                if dom:
+                    self._store(self.out_dir / f"{base}.html.gz", gzip.compress(dom.encode("utf-8")))
+            except Exception:
+                pass
+            finally:
+                self.queue.task_done()
+
+    def flush(self, timeout=30):
+        """Drain pending writes (bounded by `timeout`) and stop the thread."""
+        if not self._started:
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def summary(self):
+        return (f"{self.written} written, {self.dropped} dropped, {self.evicted} evicted, "
+                f"{self._total / 1024 / 1024:.1f} MB in {self.out_dir}/")
+
+
+def capture(driver, dom=False):
+    """(png_bytes, page_source) from the driver; either may be None."""
+    png = source = None
+    try:
+        png = driver.get_screenshot_as_png()
+    except Exception:
+        pass
+    if dom:
+        try:
+            source = driver.page_source
+        except Exception:
+            pass
+    return png, source
@@ -0,0 +1,149 @@
+"""
+Offline framework benchmark.
+
+Starts support.fixture_server, runs the existing features against it with
+timing instrumentation on, and reports wall time, WebDriver command counts
+and wait time per scenario. Compares against a saved baseline and exits 1
+when a scenario regresses beyond the tolerance.
+
+Each run gets a throwaway BEHAVE_CACHE_DIR and learned behaviour switched off
+(http_tier, adaptive_timeouts, locator_ranking), so fixture timings never
+reach the real cache and runs stay comparable with the baseline.
+
+    python -m support.benchmark -- -D headless=true
+    python -m support.benchmark --latency-ms 200 --missing Full-Name --save-baseline
+    python -m support.benchmark --tolerance 0.15 --max-commands 120
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from support.cache import CACHE_DIR, cache_path
+from support.driver_paths import CACHE_FILE
+from support.fixture_server import FixtureServer, add_config_args, config_from_args
+
+DEFAULT_BASELINE = cache_path("bench_baseline.json")
+METRICS = ("wall", "commands", "wait_seconds")
+
+
+# Learned state would make runs drift apart (and 127.0.0.1 latencies would leak
+# into the real timeout profile): every run takes the same browser code path.
+FIXED_PATH = {"http_tier": "false", "adaptive_timeouts": "false", "locator_ranking": "false"}
+
+
+def _scratch_cache():
+    """Throwaway BEHAVE_CACHE_DIR; only the resolved driver paths are carried over."""
+    scratch = Path(tempfile.mkdtemp(prefix="behave-bench-cache-"))
+    drivers = CACHE_DIR / CACHE_FILE
+    if drivers.is_file():
+        shutil.copy2(drivers, scratch / CACHE_FILE)
+    return scratch
+
+
+def run_features(server, behave_args, timings_out):
+    defines = {**server.userdata(), **FIXED_PATH,
+               "instrument": "true", "instrument_out": str(timings_out)}
+    cmd = [sys.executable, "-m", "behave", "-f", "plain", "--no-capture"]
+    for k, v in defines.items():
+        cmd += ["-D", f"{k}={v}"]
+    scratch = _scratch_cache()
+    env = {**os.environ, "BEHAVE_CACHE_DIR": str(scratch)}
+    started = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd + list(behave_args), capture_output=True, text=True, env=env)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return proc, time.perf_counter() - started
+
+
+def load_scenarios(timings_out):
+    try:
+        data = json.loads(Path(timings_out).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return {k: v for k, v in data.get("scenarios", {}).items() if k != "<setup>"}
+
+
+def compare(current, baseline, tolerance, max_commands=None, max_wall=None):
+    """List of human-readable regressions (empty when within thresholds)."""
+    problems = []
+    for name, cur in current.items():
+        if max_commands is not None and cur["commands"] > max_commands:
+            problems.append(f"{name}: {cur['commands']} commands > max {max_commands}")
+        if max_wall is not None and cur["wall"] > max_wall:
+            problems.append(f"{name}: wall {cur['wall']:.2f}s > max {max_wall:.2f}s")
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in METRICS:
+            limit = base[metric] * (1 + tolerance)
+            # Ignore noise on near-zero metrics
+            if cur[metric] > limit and cur[metric] - base[metric] > 0.05:
+                problems.append(
+                    f"{name}: {metric} {cur[metric]:.2f} vs baseline {base[metric]:.2f} "
+                    f"(+{tolerance:.0%} allowed)"
+                )
+    return problems
+
+
+def print_table(scenarios, suite_seconds):
+    print(f"{'wall':>8} {'cmds':>6} {'cmd s':>8} {'wait s':>8}  scenario")
+    for name, s in sorted(scenarios.items(), key=lambda kv: -kv[1]["wall"]):
+        print(f"{s['wall']:8.2f} {s['commands']:6d} {s['command_seconds']:8.2f} "
+              f"{s['wait_seconds']:8.2f}  {name}")
+    print(f"Suite wall time: {suite_seconds:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.benchmark")
+    add_config_args(parser)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth, 0.25 = +25%%")
+    parser.add_argument("--max-commands", type=int, default=None)
+    parser.add_argument("--max-wall", type=float, default=None)
+    parser.add_argument("behave_args", nargs="*", help="extra behave args (after --)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="behave-bench-") as tmp:
+        timings_out = Path(tmp) / "timings.json"
+        with FixtureServer(config_from_args(args)) as server:
+            proc, suite_seconds = run_features(server, args.behave_args, timings_out)
+        scenarios = load_scenarios(timings_out)
+
+    if not scenarios:
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        print("No timings recorded (did behave start a browser?)")
+        return 2
+
+    print_table(scenarios, suite_seconds)
+    if proc.returncode != 0:
+        print("WARNING: some scenarios failed against the fixtures:")
+        sys.stdout.write(proc.stdout[-2000:])
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(scenarios, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except Exception:
+        baseline = {}
+    problems = compare(scenarios, baseline, args.tolerance, args.max_commands, args.max_wall)
+    for p in problems:
+        print(f"REGRESSION: {p}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# ---------------- Local browser options ----------------
+# Shared by the local provider and the warm session pool so both launch the same browser.
+# Selenium imports are per function: a Chrome run never loads the Firefox modules.
+
+def local_chrome_options(headless=False, mobile_emulation_name=""):
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+    options = ChromeOptions()
+    # Apply Chrome mobile emulation if requested
+    if mobile_emulation_name:
+        options.add_experimental_option("mobileEmulation", {"deviceName": mobile_emulation_name})
+
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1366,900")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return options
+
+
+def local_firefox_options(headless=False):
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+    options = FirefoxOptions()
+    if headless:
+        options.add_argument("-headless")
+    return options
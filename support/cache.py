@@ -0,0 +1,41 @@
+import json
+import os
+import time
+from pathlib import Path
+
+# All runner state (durations, resolved routes, driver paths, ...) lives here.
+# Override with BEHAVE_CACHE_DIR, e.g. on CI to point at a persisted volume.
+CACHE_DIR = Path(os.getenv("BEHAVE_CACHE_DIR", ".behave_cache"))
+
+
+def cache_path(name: str) -> Path:
+    return CACHE_DIR / name
+
+
+def load_json(name: str, default=None):
+    try:
+        with open(cache_path(name), encoding="utf-8") as fh:
+            return json.load(fh)
+    except Exception:
+        return {} if default is None else default
+
+
+def save_json(name: str, data):
+    """Write atomically so parallel workers never see a half-written file."""
+    path = cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def is_fresh(entry, ttl_seconds) -> bool:
+    """Entries store their write time under "ts"."""
+    try:
+        return (time.time() - float(entry["ts"])) < float(ttl_seconds)
+    except Exception:
+        return False
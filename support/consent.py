@@ -0,0 +1,136 @@
+"""
+Google consent handling without the per-scenario wait.
+
+Before the first navigation of a session the SOCS/CONSENT cookies are set for
+the Google domain (CDP Network.setCookie on Chromium, otherwise add_cookie
+from a cheap same-origin page), so the banner normally never shows. After
+navigating, a combined find_elements call over the caller's banner locators
+checks for a banner (repeated for up to BANNER_SETTLE seconds while the page
+is still loading); only when it is actually there does the old click flow run.
+
+State is kept per (session, host) and forgotten when the browser is reset
+(support.isolation). The summary reports the waits that were skipped.
+"""
+import time
+from urllib.parse import urlparse
+
+from selenium.webdriver.common.by import By
+
+from support.js_locators import css_of
+
+# "Accept all" consent as Google sets it (SOCS for the current flow, CONSENT
+# for older frontends)
+CONSENT_COOKIES = {
+    "SOCS": "CAESHAgBEhJnd3NfMjAyMzA4MTAtMF9SQzIaAmVuIAEaBgiAo_CmBg",
+    "CONSENT": "YES+cb",
+}
+COOKIE_TTL = 365 * 24 * 3600
+# A banner can render after get() returns (eager page loads, late scripts):
+# keep looking until the page has loaded or this many seconds passed.
+BANNER_SETTLE = 1.0
+BANNER_POLL = 0.1
+
+
+def banner_css(candidates):
+    """One CSS selector list for the banner locators that can be expressed as CSS."""
+    # Candidates that can't be folded in are ignored here: the iframe or the
+    # #L2AGLb / aria-label buttons show up with any banner.
+    return ", ".join(css for css in map(css_of, candidates) if css)
+
+
+def cookie_domain(host):
+    if not host or host.replace(".", "").isdigit() or host == "localhost":
+        return host
+    return "." + (host[4:] if host.startswith("www.") else host)
+
+
+class ConsentManager:
+    def __init__(self):
+        self.settled = {}   # (session_id, host) -> how it was settled
+        self.opens = 0
+        self.banners = 0
+        self.saved = 0.0
+
+    @staticmethod
+    def _key(driver, base):
+        return getattr(driver, "session_id", None), urlparse(base).hostname
+
+    def _seed_cdp(self, driver, base, host):
+        expires = int(time.time()) + COOKIE_TTL
+        for name, value in CONSENT_COOKIES.items():
+            driver.execute_cdp_cmd("Network.setCookie", {
+                "name": name, "value": value, "url": f"{urlparse(base).scheme}://{host}/",
+                "domain": cookie_domain(host), "path": "/", "expires": expires,
+            })
+
+    def _seed_webdriver(self, driver, base, host):
+        # add_cookie only works for the current origin
+        if urlparse(driver.current_url or "").hostname != host:
+            driver.get(f"{urlparse(base).scheme}://{urlparse(base).netloc}/robots.txt")
+        for name, value in CONSENT_COOKIES.items():
+            driver.add_cookie({"name": name, "value": value, "path": "/",
+                               "domain": cookie_domain(host)})
+
+    def prepare(self, driver, base):
+        """Seed consent cookies once per session/host, before navigating."""
+        key = self._key(driver, base)
+        if key in self.settled:
+            return True
+        host = key[1]
+        seeders = [self._seed_webdriver]
+        if hasattr(driver, "execute_cdp_cmd"):
+            seeders.insert(0, self._seed_cdp)
+        for seed in seeders:
+            try:
+                seed(driver, base, host)
+                self.settled[key] = "cookies"
+                return True
+            except Exception:
+                continue
+        return False
+
+    @staticmethod
+    def banner_present(driver, css):
+        try:
+            return bool(css) and bool(driver.find_elements(By.CSS_SELECTOR, css))
+        except Exception:
+            return False
+
+    @classmethod
+    def wait_for_banner(cls, driver, css, settle=BANNER_SETTLE):
+        """Banner seen, or the page finished loading / `settle` ran out without one."""
+        deadline = time.monotonic() + settle
+        while True:
+            if cls.banner_present(driver, css):
+                return True
+            try:
+                loaded = driver.execute_script("return document.readyState") == "complete"
+            except Exception:
+                loaded = False
+            if loaded or time.monotonic() >= deadline:
+                return False
+            time.sleep(BANNER_POLL)
+
+    def handle(self, driver, base, banner, click_flow, fallback_wait):
+        """After navigating: run `click_flow()` only if one of the `banner` locators is on the page."""
+        self.opens += 1
+        started = time.perf_counter()
+        if self.wait_for_banner(driver, banner_css(banner)):
+            self.banners += 1
+            click_flow()
+            self.settled[self._key(driver, base)] = "clicked"
+            return True
+        # Without the check we'd have waited the full consent timeout here
+        self.saved += max(0.0, fallback_wait - (time.perf_counter() - started))
+        return False
+
+    def forget(self, driver=None):
+        """Browser state was reset: cookies are gone."""
+        sid = getattr(driver, "session_id", None)
+        self.settled = {k: v for k, v in self.settled.items() if driver is not None and k[0] != sid}
+
+    def summary(self):
+        if not self.opens:
+            return None
+        return (f"Consent: {self.opens} Google opens, banner shown {self.banners}x, "
+                f"~{self.saved:.1f}s of consent waits skipped")
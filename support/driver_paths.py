@@ -0,0 +1,100 @@
+"""
+Driver binary resolution with an on-disk cache keyed by browser version.
+
+webdriver-manager does version discovery (and often a network round trip) on
+every `install()`. Here the resolved driver path is cached per installed
+browser version, so a warm start is a `--version` call plus a file lookup.
+The entry is evicted when the TTL expires or the browser version changes.
+
+Offline mode (-D driver_offline=true / DRIVER_OFFLINE=1) never touches
+webdriver-manager: it uses the cache, an explicit CHROMEDRIVER/GECKODRIVER
+path, or a driver on PATH, and fails fast otherwise.
+"""
+import os
+import re
+import shutil
+import subprocess
+import time
+
+from support.cache import is_fresh, load_json, save_json
+
+CACHE_FILE = "drivers.json"
+DEFAULT_TTL = int(os.getenv("DRIVER_CACHE_TTL", 7 * 24 * 3600))  # seconds
+
+BROWSER_BINARIES = {
+    "chrome": [
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ],
+    "firefox": [
+        "firefox",
+        "/Applications/Firefox.app/Contents/MacOS/firefox",
+    ],
+}
+
+DRIVER_NAMES = {"chrome": "chromedriver", "firefox": "geckodriver"}
+DRIVER_ENV = {"chrome": "CHROMEDRIVER", "firefox": "GECKODRIVER"}
+BINARY_ENV = {"chrome": "CHROME_BINARY", "firefox": "FIREFOX_BINARY"}
+
+_VERSION_RE = re.compile(r"(\d+(?:\.\d+)+)")
+
+
+def browser_version(browser):
+    """Installed browser version string, or None when it can't be detected."""
+    candidates = [os.getenv(BINARY_ENV[browser])] + BROWSER_BINARIES[browser]
+    for binary in filter(None, candidates):
+        exe = binary if os.path.isabs(binary) else shutil.which(binary)
+        if not exe or not os.path.exists(exe):
+            continue
+        try:
+            out = subprocess.run(
+                [exe, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except Exception:
+            continue
+        m = _VERSION_RE.search(out or "")
+        if m:
+            return m.group(1)
+    return None
+
+
+def _offline_path(browser):
+    explicit = os.getenv(DRIVER_ENV[browser])
+    if explicit and os.path.exists(explicit):
+        return explicit
+    return shutil.which(DRIVER_NAMES[browser])
+
+
+def _manager_install(browser):
+    if browser == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_driver_path(browser="chrome", offline=False, ttl=None):
+    browser = "firefox" if browser == "firefox" else "chrome"
+    ttl = DEFAULT_TTL if ttl is None else ttl
+    version = browser_version(browser) or "unknown"
+
+    cache = load_json(CACHE_FILE)
+    entry = cache.get(browser)
+    if entry and entry.get("version") == version and os.path.exists(entry.get("path", "")):
+        if offline or is_fresh(entry, ttl):
+            return entry["path"]
+
+    if offline:
+        path = _offline_path(browser)
+        if not path:
+            raise RuntimeError(
+                f"Offline driver resolution failed for {browser} {version}: no cached driver, "
+                f"set {DRIVER_ENV[browser]}=/path/to/{DRIVER_NAMES[browser]} or put it on PATH."
+            )
+    else:
+        path = _manager_install(browser)
+
+    # One entry per browser: a new browser version replaces (evicts) the old one.
+    cache[browser] = {"version": version, "path": path, "ts": time.time()}
+    save_json(CACHE_FILE, cache)
+    return path
@@ -0,0 +1,217 @@
+"""
+Local stand-ins for the Reelly and Google pages our features touch.
+
+    python -m support.fixture_server --port 8765 --latency-ms 150 --redirect-signin
+
+Routes (one server, so every base URL points at it):
+  /auth/sign-up            sign-up form (Full-Name / phone2 / Email-3 / wizde attrs)
+  /sign-in                 sign-in page with a "Create account" link
+  /find?..., /?...         filters page; 302 -> /sign-in when redirect_signin is on
+  /google/                 search home (input[name=q], btnK, optional consent button)
+  /google/search?q=...     results page (#search, a h3, div[data-hveid])
+  anything else            404 page
+
+Behaviour knobs: per-response latency, locators to drop (forces fallbacks),
+redirect-to-sign-in for the filters URL and the Google consent banner.
+"""
+import argparse
+import html
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class FixtureConfig:
+    latency_ms: int = 0
+    missing: set = field(default_factory=set)   # id/wizde values, e.g. {"Full-Name", "phoneInput"}
+    redirect_signin: bool = False
+    consent_banner: bool = False
+
+
+def _page(title, body):
+    return (
+        "<!doctype html><html><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title></head><body>{body}</body></html>"
+    )
+
+
+def _input(cfg, id_, **attrs):
+    """<input>; an id or wizde value listed in cfg.missing is left out."""
+    attrs = {"id": id_, **attrs}
+    parts = [
+        f'{k.replace("_", "-")}="{html.escape(str(v))}"'
+        for k, v in attrs.items()
+        if not (k in ("id", "wizde") and v in cfg.missing)
+    ]
+    return f"<input {' '.join(parts)}>"
+
+
+def signup_html(cfg):
+    form = "".join([
+        _input(cfg, "Full-Name", wizde="fullNameInput", data_name="Full-Name",
+               placeholder="Full name", type="text"),
+        _input(cfg, "phone2", wizde="phoneInput", placeholder="Phone", type="tel"),
+        _input(cfg, "Email-3", placeholder="Email", type="email"),
+        _input(cfg, "field", wizde="passwordInput", type="password"),
+    ])
+    return _page("Reelly — Sign up", f"<h1>Create account</h1><form>{form}</form>")
+
+
+def signin_html():
+    return _page(
+        "Reelly — Log in",
+        '<h1>Sign in</h1><a href="/auth/sign-up">Create account</a>',
+    )
+
+
+def find_html():
+    # Also the home page: its header link is the sign-up fallback in main_page_steps
+    return _page(
+        "Reelly — Find",
+        "<nav><a href='/auth/sign-up'>Sign up</a></nav>"
+        "<h1>Off-plan projects</h1><div id='filters'></div>",
+    )
+
+
+def google_home_html(cfg):
+    consent = ""
+    if cfg.consent_banner:
+        consent = (
+            "<div id='consent'><button id='L2AGLb' "
+            "onclick=\"this.parentNode.remove()\">Accept all</button></div>"
+        )
+    return _page(
+        "Google",
+        consent
+        + "<form action='/google/search' method='get'>"
+          "<input type='text' name='q' title='Search'>"
+          "<input type='submit' name='btnK' value='Google Search'></form>",
+    )
+
+
+def google_results_html(query):
+    q = html.escape(query)
+    items = "".join(
+        f"<div data-hveid='{i}'><a href='#r{i}'><h3>{q} result {i}</h3></a></div>" for i in range(5)
+    )
+    return _page(f"{q} - Google Search", f"<div id='center_col'><div id='search'>{items}</div></div>")
+
+
+def not_found_html():
+    return _page("404 Not Found", "<h1>404</h1><p>Page not found</p>")
+
+
+def _handler_for(cfg):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, body="", headers=None):
+            if cfg.latency_ms:
+                time.sleep(cfg.latency_ms / 1000.0)
+            raw = body.encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(raw)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(raw)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            path = url.path.rstrip("/") or "/"
+            if path in ("/auth/sign-up", "/sign-up", "/signup"):
+                return self._send(200, signup_html(cfg))
+            if path == "/sign-in":
+                return self._send(200, signin_html())
+            if path in ("/", "/find"):
+                if cfg.redirect_signin and url.query:
+                    return self._send(302, headers={"Location": "/sign-in"})
+                return self._send(200, find_html())
+            if path == "/google":
+                return self._send(200, google_home_html(cfg))
+            if path == "/google/search":
+                query = parse_qs(url.query).get("q", [""])[0]
+                return self._send(200, google_results_html(query))
+            self._send(404, not_found_html())
+
+        do_HEAD = do_GET
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+class FixtureServer:
+    """Threaded server for in-process use: `with FixtureServer(cfg) as srv: srv.url`."""
+
+    def __init__(self, config=None, port=0):
+        self.config = config or FixtureConfig()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self.config))
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def userdata(self):
+        """behave -D overrides that point every feature at this server."""
+        return {
+            "reelly_base": self.url,
+            "find_base": self.url,
+            "soft_base": self.url,
+            "google_base": f"{self.url}/google",
+        }
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_config_args(parser):
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--missing", default="", help="comma-separated id/wizde values to drop, e.g. Full-Name,phoneInput")
+    parser.add_argument("--redirect-signin", action="store_true")
+    parser.add_argument("--consent-banner", action="store_true")
+
+
+def config_from_args(args):
+    return FixtureConfig(
+        latency_ms=args.latency_ms,
+        missing={m.strip() for m in args.missing.split(",") if m.strip()},
+        redirect_signin=args.redirect_signin,
+        consent_banner=args.consent_banner,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.fixture_server")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_args(parser)
+    args = parser.parse_args(argv)
+    srv = FixtureServer(config_from_args(args), port=args.port)
+    print(f"Fixtures on {srv.url}; behave flags:")
+    print("  " + " ".join(f'-D {k}="{v}"' for k, v in srv.userdata().items()))
+    try:
+        srv.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Retry failed scenarios in the open session and keep flake statistics.
+
+-D retries=N re-runs a failed scenario up to N more times in the same
+browser (behave's scenario_autoretry, applied in before_feature), so a
+transient redirect or consent popup costs one scenario, not a cold rerun of
+the suite. Scenarios that passed are never re-run.
+
+Every run appends one outcome per scenario to .behave_cache/flakes.json:
+  pass   passed on the first attempt
+  flaky  failed, then passed on a retry
+  fail   failed every attempt
+
+Scenarios whose recent flaky+fail rate reaches the threshold are quarantined.
+-D lane=stable skips them, -D lane=quarantine runs only them (default: all).
+
+    python -m support.flakes          # per-scenario table
+"""
+import sys
+import threading
+import time
+
+from support.cache import load_json, save_json
+
+FLAKES_FILE = "flakes.json"
+HISTORY = 20          # outcomes kept per scenario
+MIN_RUNS = 5          # before a scenario can be quarantined
+DEFAULT_RATE = 0.2    # flaky+fail share that quarantines
+LANES = ("all", "stable", "quarantine")
+
+_lock = threading.Lock()
+_state = {"data": None, "attempts": {}}
+
+
+def _data():
+    if _state["data"] is None:
+        _state["data"] = load_json(FLAKES_FILE)
+    return _state["data"]
+
+
+def outcome_of(statuses):
+    if not statuses:
+        return None
+    if statuses[-1] != "passed":
+        return "fail"
+    return "pass" if len(statuses) == 1 else "flaky"
+
+
+def rate(entry):
+    history = entry.get("history", [])
+    if not history:
+        return 0.0
+    return sum(1 for o in history if o != "pass") / len(history)
+
+
+def is_quarantined(key, threshold=DEFAULT_RATE):
+    with _lock:
+        entry = _data().get(key) or {}
+    return len(entry.get("history", [])) >= MIN_RUNS and rate(entry) >= threshold
+
+
+def skip_reason(key, lane, threshold=DEFAULT_RATE):
+    """Why a scenario is outside this lane, or None if it should run."""
+    if lane not in LANES:
+        raise ValueError(f"Unknown lane {lane!r}; expected one of {LANES}")
+    if lane == "all":
+        return None
+    quarantined = is_quarantined(key, threshold)
+    if lane == "stable" and quarantined:
+        return "quarantined (flaky); runs in -D lane=quarantine"
+    if lane == "quarantine" and not quarantined:
+        return "not quarantined; runs in the stable lane"
+    return None
+
+
+def attempt(key, status):
+    """Call from after_scenario: once per attempt."""
+    with _lock:
+        _state["attempts"].setdefault(key, []).append(status)
+
+
+def flush():
+    """Append this run's outcomes (merged with what other workers wrote)."""
+    with _lock:
+        if not _state["attempts"]:
+            return
+        on_disk = load_json(FLAKES_FILE)
+        for key, statuses in _state["attempts"].items():
+            outcome = outcome_of(statuses)
+            if outcome is None or statuses[-1] in ("skipped", "untested"):
+                continue
+            entry = on_disk.setdefault(key, {"history": []})
+            entry["history"] = (entry["history"] + [outcome])[-HISTORY:]
+            entry["attempts_last"] = len(statuses)
+            entry["ts"] = time.time()
+        save_json(FLAKES_FILE, on_disk)
+        _state["data"] = on_disk
+        _state["attempts"] = {}
+
+
+def print_report(threshold=DEFAULT_RATE):
+    data = load_json(FLAKES_FILE)
+    if not data:
+        print("No flake history yet.")
+        return
+    print(f"{'rate':>5} {'runs':>5} {'flaky':>5} {'fail':>5}  scenario")
+    for key, entry in sorted(data.items(), key=lambda kv: -rate(kv[1])):
+        h = entry.get("history", [])
+        mark = "  [quarantined]" if len(h) >= MIN_RUNS and rate(entry) >= threshold else ""
+        print(f"{rate(entry):>5.0%} {len(h):>5} {h.count('flaky'):>5} {h.count('fail'):>5}  {key}{mark}")
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    threshold = float(argv[0]) if argv else DEFAULT_RATE
+    print_report(threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
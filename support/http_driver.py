@@ -0,0 +1,153 @@
+"""
+Browser-free driver for the @http tier.
+
+Scenarios tagged @http that only look at URLs, redirects and titles run
+against HttpDriver instead of the browser. It follows redirects (with a
+cookie jar, like a browser session), parses <title>, and answers the subset of
+the WebDriver API those steps use: get, current_url, title, page_source, and
+page_snapshot via snapshot().
+
+Anything that needs a rendered page (scripts, element lookups, screenshots)
+raises NeedsBrowser. So does get() on a response the browser would keep
+changing: an SPA app shell (script bundle plus an empty mount point), or a
+script / meta-refresh redirect. Its 200, URL and static title say nothing
+about where the app ends up. environment.py then re-runs the scenario on the real driver, so an
+@http scenario is never less capable than a browser one. It is only faster
+when the server response already answers the question.
+"""
+import functools
+import http.cookiejar
+import re
+import urllib.error
+import urllib.request
+
+from selenium.common.exceptions import WebDriverException
+
+from support.routes import PROBE_TIMEOUT, USER_AGENT, html_title
+
+_TAG_RE = re.compile(r"<script.*?</script>|<style.*?</style>|<[^>]+>", re.I | re.S)
+# SPA shell markers: a script bundle plus an empty mount point (or next to no body text)
+_SCRIPT_SRC_RE = re.compile(r"<script\b[^>]*\bsrc\s*=", re.I)
+_EMPTY_MOUNT_RE = re.compile(
+    r"<(div|main|section)\b[^>]*\bid\s*=\s*[\"'](?:root|app|__next|__nuxt|svelte)[\"'][^>]*>\s*</\1>"
+    r"|<app-root\b[^>]*>\s*</app-root>",
+    re.I,
+)
+_BODY_RE = re.compile(r"<body\b[^>]*>(.*)</body>", re.I | re.S)
+SHELL_MAX_WORDS = 5
+# Redirects urllib never follows: script navigation and <meta http-equiv="refresh">
+_CLIENT_REDIRECT_RE = re.compile(
+    r"(?<![\w-])location(?:\.href)?\s*=(?!=)|(?<![\w-])location\.(?:replace|assign)\s*\("
+    r"|<meta\b[^>]*http-equiv\s*=\s*[\"']?refresh",
+    re.I,
+)
+
+
+def is_app_shell(html) -> bool:
+    """Client-rendered page: the server answers 200 + static title for any route."""
+    if not _SCRIPT_SRC_RE.search(html or ""):
+        return False
+    if _EMPTY_MOUNT_RE.search(html):
+        return True
+    body = _BODY_RE.search(html)
+    return len(_TAG_RE.sub(" ", body.group(1) if body else html).split()) <= SHELL_MAX_WORDS
+
+
+def rendered_client_side(html) -> bool:
+    """The response alone doesn't show what the browser ends up on (SPA shell or JS/meta redirect)."""
+    return is_app_shell(html) or bool(_CLIENT_REDIRECT_RE.search(html or ""))
+
+
+class NeedsBrowser(WebDriverException):
+    """The step asked for something only a rendered page can answer."""
+
+
+class HttpDriver:
+    session_id = "http"
+    http_tier = True
+
+    def __init__(self, timeout=PROBE_TIMEOUT):
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self._opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+        self.current_url = "about:blank"
+        self.status = None
+        self.page_source = ""
+        self.requests = 0
+
+    # ---- navigation ----
+    def get(self, url):
+        self.requests += 1
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        try:
+            with self._opener.open(req, timeout=self.timeout) as resp:
+                self.status, self.current_url = resp.status, resp.geturl()
+                self.page_source = resp.read(1024 * 1024).decode("utf-8", "replace")
+        except urllib.error.HTTPError as e:
+            self.status, self.current_url = e.code, e.geturl() or url
+            self.page_source = e.read(1024 * 1024).decode("utf-8", "replace")
+        except urllib.error.URLError as e:
+            raise WebDriverException(f"HTTP tier could not load {url}: {e.reason}")
+        if rendered_client_side(self.page_source):
+            # current_url / title would describe the shell, not where the app lands
+            raise NeedsBrowser(f"{self.current_url} is rendered or redirected client-side")
+
+    @property
+    def title(self):
+        return html_title(self.page_source)
+
+    def snapshot(self, landmarks=(), text_signs=()):
+        """Same shape as support.snapshot.page_snapshot, from the HTTP response."""
+        if landmarks:
+            raise NeedsBrowser("landmark locators need a rendered page")
+        text = _TAG_RE.sub(" ", self.page_source).lower()
+        return {
+            "url": self.current_url,
+            "title": self.title,
+            "readyState": "complete",
+            "status": self.status,
+            "landmarks": [],
+            "text_hits": [s for s in text_signs if s.lower() in text],
+        }
+
+    # ---- rendering-only API: hand over to the browser ----
+    def _needs_browser(self, *args, **kwargs):
+        raise NeedsBrowser("step needs JS rendering; falling back to the browser")
+
+    execute_script = execute_async_script = _needs_browser
+    find_element = find_elements = _needs_browser
+    get_screenshot_as_png = save_screenshot = _needs_browser
+
+    # ---- harmless no-ops for hooks ----
+    window_handles = ["http"]
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+def patch_scenario_with_browser_failover(scenario):
+    """Run on the HTTP tier first; re-run on the browser if that fails.
+
+    Like behave.contrib.scenario_autoretry: patches Scenario.run, and hooks see
+    `scenario.http_attempt` to pick the driver.
+    """
+    def run_with_failover(scenario_run, *args, **kwargs):
+        scenario.http_attempt = True
+        failed = scenario_run(*args, **kwargs)
+        scenario.http_attempt = False
+        if failed:
+            print("HTTP TIER FAILED, RE-RUNNING SCENARIO IN THE BROWSER")
+            failed = scenario_run(*args, **kwargs)
+        return failed
+
+    scenario.http_attempt = False
+    scenario.run = functools.partial(run_with_failover, scenario.run)
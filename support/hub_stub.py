@@ -0,0 +1,187 @@
+"""
+Minimal Selenium-compatible (W3C) hub stand-in for exercising the matrix
+scheduler without a cloud account.
+
+    python -m support.hub_stub --port 4444 --max-sessions 2
+    python -m support.matrix matrix.json -D max_sessions=2 -D hub_url=http://127.0.0.1:4444/wd/hub
+
+Sessions are tracked like a cloud hub would: creating one beyond
+--max-sessions fails with "session not created". Navigation, title, scripts,
+screenshots and window calls answer with plausible values; element lookups
+find nothing, so scenarios fail at their first wait. GET /status reports
+active and peak concurrent sessions.
+"""
+import argparse
+import base64
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 1x1 transparent PNG
+PIXEL_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6300010000000500010d0a2db40000000049454e44ae426082"
+)).decode("ascii")
+
+
+class HubState:
+    def __init__(self, max_sessions=0):
+        self.max_sessions = max_sessions   # 0 = unlimited
+        self.sessions = {}                 # id -> {"url": ..., "caps": ...}
+        self.peak = 0
+        self.created = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def create(self, caps):
+        with self.lock:
+            if self.max_sessions and len(self.sessions) >= self.max_sessions:
+                self.rejected += 1
+                return None
+            sid = uuid.uuid4().hex
+            self.sessions[sid] = {"url": "about:blank", "caps": caps}
+            self.created += 1
+            self.peak = max(self.peak, len(self.sessions))
+            return sid
+
+    def status(self):
+        with self.lock:
+            return {
+                "ready": not self.max_sessions or len(self.sessions) < self.max_sessions,
+                "message": "hub stub",
+                "active": len(self.sessions),
+                "peak": self.peak,
+                "created": self.created,
+                "rejected": self.rejected,
+                "max_sessions": self.max_sessions,
+            }
+
+
+def _handler_for(state):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code, value):
+            raw = json.dumps({"value": value}).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def _error(self, code, error, message):
+            self._reply(code, {"error": error, "message": message, "stacktrace": ""})
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return {}
+
+        def _route(self, method):
+            parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+            if parts[:2] == ["wd", "hub"]:
+                parts = parts[2:]
+            body = self._body() if method == "POST" else {}
+
+            if parts == ["status"]:
+                return self._reply(200, state.status())
+            if parts == ["session"] and method == "POST":
+                caps = (body.get("capabilities") or {}).get("alwaysMatch") or {}
+                sid = state.create(caps)
+                if sid is None:
+                    return self._error(500, "session not created", "parallel session limit reached")
+                return self._reply(200, {"sessionId": sid, "capabilities": {**caps, "stub": True}})
+            if not parts or parts[0] != "session" or len(parts) < 2:
+                return self._error(404, "unknown command", self.path)
+
+            sid, cmd = parts[1], "/".join(parts[2:])
+            session = state.sessions.get(sid)
+            if session is None:
+                return self._error(404, "invalid session id", sid)
+            if not cmd and method == "DELETE":
+                with state.lock:
+                    state.sessions.pop(sid, None)
+                return self._reply(200, None)
+            if cmd == "url":
+                if method == "POST":
+                    session["url"] = body.get("url", "about:blank")
+                    return self._reply(200, None)
+                return self._reply(200, session["url"])
+            if cmd == "title":
+                return self._reply(200, "Hub stub")
+            if cmd == "screenshot":
+                return self._reply(200, PIXEL_PNG)
+            if cmd == "source":
+                return self._reply(200, "<html><head><title>Hub stub</title></head><body></body></html>")
+            if cmd == "elements":
+                return self._reply(200, [])
+            if cmd == "element":
+                return self._error(404, "no such element", "hub stub has no DOM")
+            if cmd == "window/handles":
+                return self._reply(200, [f"window-{sid[:8]}"])
+            if cmd in ("window", "window/handle"):
+                return self._reply(200, f"window-{sid[:8]}")
+            if cmd.startswith("window/"):
+                return self._reply(200, {"x": 0, "y": 0, "width": 1366, "height": 900})
+            return self._reply(200, None)
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def do_DELETE(self):
+            self._route("DELETE")
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+class HubStub:
+    """In-process hub: `with HubStub(max_sessions=2) as hub: hub.url`."""
+
+    def __init__(self, max_sessions=0, port=0):
+        self.state = HubState(max_sessions)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self.state))
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}/wd/hub"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.hub_stub")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument("--max-sessions", type=int, default=0, help="0 = unlimited")
+    args = parser.parse_args(argv)
+    hub = HubStub(args.max_sessions, args.port)
+    print(f"Hub stub on {hub.url} (max sessions: {args.max_sessions or 'unlimited'})")
+    try:
+        hub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Timing instrumentation (-D instrument=true).
+
+Records latency of every WebDriver command (by wrapping driver.execute), every
+WebDriverWait.until/until_not and every behave step, tagged with the scenario,
+the page object / step function that issued it and the locator involved.
+Results go to reports/timings.json (override with -D instrument_out=...), one
+Allure attachment per scenario, and a "top slowest" summary in after_all.
+"""
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_OUT = "reports/timings.json"
+TOP_N = 10
+
+_BY_VALUES = {v for k, v in vars(By).items() if k.isupper()}
+_OWN_DIRS = (f"{os.sep}pages{os.sep}", f"{os.sep}steps{os.sep}", f"{os.sep}app{os.sep}")
+
+
+class Recorder:
+    def __init__(self):
+        self.scenario = None
+        self.scenario_started = None
+        self.scenarios = {}   # name -> totals
+        self.steps = []
+        self.waits = []
+        self.commands = defaultdict(lambda: {"count": 0, "seconds": 0.0})
+        # seconds = wait time, plus find commands issued outside any wait
+        self.locators = defaultdict(lambda: {"count": 0, "seconds": 0.0, "timeouts": 0})
+        self.wait_depth = 0
+
+    def _totals(self):
+        name = self.scenario or "<setup>"
+        return self.scenarios.setdefault(name, {
+            "wall": 0.0, "commands": 0, "command_seconds": 0.0,
+            "waits": 0, "wait_seconds": 0.0, "steps": 0,
+        })
+
+    def command(self, name, seconds, locator=None):
+        t = self._totals()
+        t["commands"] += 1
+        t["command_seconds"] += seconds
+        c = self.commands[name]
+        c["count"] += 1
+        c["seconds"] += seconds
+        if locator and not self.wait_depth:
+            loc = self.locators[locator]
+            loc["count"] += 1
+            loc["seconds"] += seconds
+
+    def wait(self, seconds, ok, locator=None, origin=None):
+        t = self._totals()
+        t["waits"] += 1
+        t["wait_seconds"] += seconds
+        self.waits.append({
+            "scenario": self.scenario, "origin": origin, "locator": locator,
+            "seconds": round(seconds, 4), "ok": ok,
+        })
+        if locator:
+            loc = self.locators[locator]
+            loc["count"] += 1
+            loc["seconds"] += seconds
+            loc["timeouts"] += 0 if ok else 1
+
+    def step(self, name, seconds, status):
+        self._totals()["steps"] += 1
+        self.steps.append({
+            "scenario": self.scenario, "step": name, "seconds": round(seconds, 4), "status": status,
+        })
+
+    def start_scenario(self, name):
+        self.scenario = name
+        self.scenario_started = time.perf_counter()
+        self._totals()
+
+    def end_scenario(self):
+        totals = self._totals()
+        if self.scenario_started is not None:
+            totals["wall"] += time.perf_counter() - self.scenario_started
+        name, self.scenario, self.scenario_started = self.scenario, None, None
+        return name, totals
+
+    def summary(self, top=TOP_N):
+        steps = sorted(self.steps, key=lambda s: -s["seconds"])[:top]
+        locators = sorted(
+            ({"locator": k, **v} for k, v in self.locators.items()), key=lambda x: -x["seconds"]
+        )[:top]
+        return {"slowest_steps": steps, "slowest_locators": locators}
+
+    def to_dict(self):
+        return {
+            "scenarios": self.scenarios,
+            "steps": self.steps,
+            "waits": self.waits,
+            "commands": dict(self.commands),
+            "locators": dict(self.locators),
+            "summary": self.summary(),
+        }
+
+
+_recorder = None
+_orig_until = WebDriverWait.until
+_orig_until_not = WebDriverWait.until_not
+
+
+def recorder():
+    return _recorder
+
+
+# ---------------- Tagging ----------------
+
+def _origin():
+    """module.function of the nearest page object / step / app frame."""
+    f = sys._getframe(2)
+    while f is not None:
+        fn = f.f_code.co_filename
+        if any(d in fn for d in _OWN_DIRS):
+            return f"{Path(fn).stem}.{f.f_code.co_name}"
+        f = f.f_back
+    return None
+
+
+def _locator_str(value):
+    if isinstance(value, tuple) and len(value) == 2 and value[0] in _BY_VALUES:
+        return f"{value[0]}={value[1]}"
+    return None
+
+
+def _locator_of(method):
+    """Best effort: pull the locator out of an expected_conditions / wait_any closure."""
+    for cell in (getattr(method, "__closure__", None) or ()):
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        loc = _locator_str(value)
+        if loc:
+            return loc
+        if isinstance(value, list) and value:
+            locs = [_locator_str(v) or getattr(v, "__name__", "?") for v in value]
+            return "any[" + " | ".join(locs) + "]"
+    return None
+
+
+def event_wait(seconds, ok, locator=None):
+    """Record a wait that ran inside the page (support.waits event mode), not via WebDriverWait."""
+    if _recorder is not None:
+        _recorder.wait(seconds, ok, _locator_str(locator), _origin())
+
+
+# ---------------- Hooks ----------------
+
+def _timed_until(orig):
+    def until(self, method, message=""):
+        rec = _recorder
+        started = time.perf_counter()
+        ok = False
+        if rec is not None:
+            rec.wait_depth += 1
+        try:
+            value = orig(self, method, message)
+            ok = True
+            return value
+        finally:
+            if rec is not None:
+                rec.wait_depth -= 1
+                rec.wait(time.perf_counter() - started, ok, _locator_of(method), _origin())
+    return until
+
+
+def instrument(driver):
+    """Wrap driver.execute in place; returns the same driver."""
+    orig = driver.execute
+
+    def execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return orig(driver_command, params)
+        finally:
+            if _recorder is not None:
+                locator = None
+                if params and "using" in params and "value" in params:
+                    locator = f"{params['using']}={params['value']}"
+                _recorder.command(driver_command, time.perf_counter() - started, locator)
+
+    driver.execute = execute
+    return driver
+
+
+def enable():
+    global _recorder
+    _recorder = Recorder()
+    WebDriverWait.until = _timed_until(_orig_until)
+    WebDriverWait.until_not = _timed_until(_orig_until_not)
+    return _recorder
+
+
+def disable():
+    global _recorder
+    WebDriverWait.until = _orig_until
+    WebDriverWait.until_not = _orig_until_not
+    _recorder = None
+
+
+# ---------------- Output ----------------
+
+def attach_scenario(name, totals):
+    try:
+        from allure_commons.types import AttachmentType
+        from allure_commons._allure import attach as allure_attach
+        steps = [s for s in _recorder.steps if s["scenario"] == name]
+        body = json.dumps({"totals": totals, "steps": steps}, indent=2)
+        allure_attach(body, name="timings", attachment_type=AttachmentType.JSON)
+    except Exception:
+        pass
+
+
+def write(path=DEFAULT_OUT):
+    if _recorder is None:
+        return None
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(_recorder.to_dict(), indent=2), encoding="utf-8")
+    return out
+
+
+def print_summary(top=TOP_N):
+    if _recorder is None:
+        return
+    s = _recorder.summary(top)
+    print(f"\n---- Top {top} slowest steps ----")
+    for row in s["slowest_steps"]:
+        print(f"{row['seconds']:8.2f}s  {row['step']}  [{row['scenario']}]")
+    print(f"---- Top {top} slowest locators ----")
+    for row in s["slowest_locators"]:
+        print(f"{row['seconds']:8.2f}s  x{row['count']:<3} timeouts={row['timeouts']}  {row['locator']}")
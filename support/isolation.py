@@ -0,0 +1,171 @@
+"""
+Per-scenario state reset on a shared driver (-D isolation=reset|bidi).
+
+Scenarios share the session from before_all; without a reset, cookies,
+storage and stray windows (sign-in redirects, Google consent) leak from one
+feature into the next. reset() puts the browser back to a clean state in a
+fraction of a relaunch:
+
+- extra windows/tabs are closed
+- bidi: a fresh BiDi user context (own cookie jar + storage) replaces the old
+  one; needs a driver started with webSocketUrl (see request_bidi)
+- Chromium: CDP Network.clearBrowserCookies + Storage.clearDataForOrigin for
+  every origin seen so far
+- others: per visited origin, navigate there and clear cookies plus
+  local/session storage (WebDriver can only touch the current origin)
+
+Reset timings are reported next to the measured cost of starting a session.
+"""
+import time
+from urllib.parse import urlparse
+
+MODES = ("off", "reset", "bidi")
+
+STORAGE_CLEAR_JS = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+CDP_STORAGE_TYPES = "cookies,local_storage,indexeddb,cache_storage,service_workers,websql,file_systems"
+
+
+def request_bidi(options):
+    """Ask for a BiDi websocket so user contexts are available."""
+    try:
+        options.set_capability("webSocketUrl", True)
+    except Exception:
+        pass
+    return options
+
+
+def _origin(url):
+    p = urlparse(url or "")
+    if p.scheme not in ("http", "https") or not p.netloc:
+        return None
+    return f"{p.scheme}://{p.netloc}"
+
+
+class Isolation:
+    def __init__(self, driver, mode="reset", relaunch_seconds=None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown isolation mode {mode!r}; expected one of {MODES}")
+        self.driver = driver
+        self.mode = mode
+        self.relaunch_seconds = relaunch_seconds
+        self.origins = set()
+        self.user_context = None
+        self.resets = []   # seconds per reset
+        self.strategy = None
+        self.used = False  # anything ran since the last reset
+
+    def note(self, driver=None):
+        """Remember the current origin (call after each step)."""
+        try:
+            origin = _origin((driver or self.driver).current_url)
+        except Exception:
+            return
+        self.used = True
+        if origin:
+            self.origins.add(origin)
+
+    def rebind(self, driver):
+        """Follow a recycled session; it starts clean, so nothing to reset yet."""
+        self.driver = driver
+        self.origins.clear()
+        self.user_context = None
+        self.used = False
+
+    # ---- strategies ----
+    def _close_extra_windows(self):
+        d = self.driver
+        handles = d.window_handles
+        for h in handles[1:]:
+            d.switch_to.window(h)
+            d.close()
+        d.switch_to.window(handles[0])
+
+    def _bidi_available(self):
+        caps = getattr(self.driver, "capabilities", {}) or {}
+        return isinstance(caps.get("webSocketUrl"), str)
+
+    def _reset_bidi(self):
+        d = self.driver
+        old_handles = d.window_handles
+        ctx = d.browser.create_user_context()
+        tab = d.browsing_context.create(type="tab", user_context=ctx)
+        d.switch_to.window(tab)
+        for h in old_handles:
+            d.switch_to.window(h)
+            d.close()
+        d.switch_to.window(tab)
+        if self.user_context:
+            try:
+                d.browser.remove_user_context(self.user_context)
+            except Exception:
+                pass
+        self.user_context = ctx
+
+    def _reset_cdp(self):
+        d = self.driver
+        self._close_extra_windows()
+        # Session storage is per tab: clear it on the page we're leaving
+        try:
+            d.execute_script(STORAGE_CLEAR_JS)
+        except Exception:
+            pass
+        d.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in self.origins:
+            d.execute_cdp_cmd("Storage.clearDataForOrigin",
+                              {"origin": origin, "storageTypes": CDP_STORAGE_TYPES})
+        d.get("about:blank")
+
+    def _reset_webdriver(self):
+        d = self.driver
+        self._close_extra_windows()
+        current = _origin(d.current_url)
+        # Current origin first (no navigation needed), then the rest
+        for origin in sorted(self.origins, key=lambda o: o != current):
+            try:
+                if origin != _origin(d.current_url):
+                    d.get(f"{origin}/robots.txt")
+                d.delete_all_cookies()
+                d.execute_script(STORAGE_CLEAR_JS)
+            except Exception:
+                continue
+        d.get("about:blank")
+
+    def reset(self):
+        """Clean cookies/storage/windows; returns seconds spent (None if skipped)."""
+        if self.mode == "off" or not self.used:
+            return None
+        started = time.perf_counter()
+        strategies = []
+        if self.mode == "bidi" and self._bidi_available():
+            strategies.append(("bidi-user-context", self._reset_bidi))
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            strategies.append(("cdp", self._reset_cdp))
+        strategies.append(("webdriver", self._reset_webdriver))
+        for name, strategy in strategies:
+            try:
+                strategy()
+                self.strategy = name
+                break
+            except Exception:
+                continue
+        self.origins.clear()
+        self.used = False
+        seconds = time.perf_counter() - started
+        self.resets.append(seconds)
+        return seconds
+
+    def summary(self):
+        if not self.resets:
+            return None
+        avg = sum(self.resets) / len(self.resets)
+        line = (f"Isolation ({self.strategy}): {len(self.resets)} resets, "
+                f"avg {avg * 1000:.0f} ms")
+        if self.relaunch_seconds:
+            saved = len(self.resets) * (self.relaunch_seconds - avg)
+            line += (f" vs ~{self.relaunch_seconds:.1f}s per browser relaunch "
+                     f"(~{saved:.1f}s saved)")
+        return line
@@ -0,0 +1,88 @@
+"""
+Selenium locators evaluated inside the page.
+
+Lets one execute_script() resolve many (By, selector) fallbacks at once
+instead of a find_element round trip per candidate. Prepend FIND_JS to a
+script and call __find([by, sel], visibleOnly) / __findAny(cands, visibleOnly).
+
+css_of() / combined_css() turn locators into CSS for single-query checks.
+"""
+import re
+
+from selenium.webdriver.common.by import By
+
+# By.* strategies we can evaluate with plain DOM APIs
+SUPPORTED = {By.ID, By.CSS_SELECTOR, By.XPATH, By.NAME, By.TAG_NAME, By.CLASS_NAME}
+
+FIND_JS = r"""
+function __visible(el) {
+  if (!el || !el.getBoundingClientRect) return false;
+  var r = el.getBoundingClientRect(), s = window.getComputedStyle(el);
+  return (r.width > 0 || r.height > 0) && s.visibility !== 'hidden' && s.display !== 'none';
+}
+function __all(by, sel) {
+  var list = [];
+  try {
+    if (by === 'id') { var n = document.getElementById(sel); if (n) list = [n]; }
+    else if (by === 'css selector') list = Array.prototype.slice.call(document.querySelectorAll(sel));
+    else if (by === 'name') list = Array.prototype.slice.call(document.getElementsByName(sel));
+    else if (by === 'tag name') list = Array.prototype.slice.call(document.getElementsByTagName(sel));
+    else if (by === 'class name') list = Array.prototype.slice.call(document.getElementsByClassName(sel));
+    else if (by === 'xpath') {
+      var r = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (var i = 0; i < r.snapshotLength; i++) list.push(r.snapshotItem(i));
+    }
+  } catch (e) {}
+  return list;
+}
+function __find(loc, visibleOnly) {
+  var list = __all(loc[0], loc[1]);
+  for (var i = 0; i < list.length; i++) {
+    if (!visibleOnly || __visible(list[i])) return list[i];
+  }
+  return null;
+}
+function __findAny(cands, visibleOnly) {
+  for (var i = 0; i < cands.length; i++) {
+    var el = __find(cands[i], visibleOnly);
+    if (el) return {el: el, index: i};
+  }
+  return null;
+}
+"""
+
+
+def to_js(candidates):
+    """[(By.X, sel), ...] -> [[by, sel], ...] keeping only DOM-evaluable ones."""
+    return [[by, sel] for by, sel in candidates if by in SUPPORTED]
+
+
+# ---------------- Combined selectors ----------------
+
+_SIMPLE_IDENT = re.compile(r"^[A-Za-z_][\w-]*$")
+
+
+def css_of(locator):
+    """CSS equivalent of a locator, or None (XPath / link text)."""
+    by, sel = locator
+    if by == By.CSS_SELECTOR:
+        return sel
+    if by == By.ID:
+        return f"#{sel}" if _SIMPLE_IDENT.match(sel) else f'[id="{sel}"]'
+    if by == By.NAME:
+        return f'[name="{sel}"]'
+    if by == By.CLASS_NAME and _SIMPLE_IDENT.match(sel):
+        return f".{sel}"
+    if by == By.TAG_NAME:
+        return sel
+    return None
+
+
+def combined_css(candidates):
+    """'a, b, c' when every candidate is CSS-expressible (2+), else None."""
+    if len(candidates) < 2 or any(callable(c) for c in candidates):
+        return None
+    parts = [css_of(c) for c in candidates]
+    if any(p is None for p in parts):
+        return None
+    return ", ".join(parts)
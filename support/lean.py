@@ -0,0 +1,143 @@
+"""
+"Lean" browser profile (-D lean=true).
+
+- `eager` page-load strategy: navigations return at DOMContentLoaded instead
+  of waiting for every image/font/video.
+- Chromium (local Chrome/Edge): block resource types and third-party URL
+  patterns through CDP Network.setBlockedURLs.
+- Firefox: prefs that disable images, web fonts and media autoplay (Firefox
+  has no URL-pattern equivalent in prefs).
+
+Per-navigation cost is measured from Resource Timing. Runs without lean (with
+-D lean_report=true) store a baseline per URL; lean runs report the bytes and
+load time saved against it.
+"""
+from urllib.parse import urlparse
+
+from support.cache import load_json, save_json
+
+BASELINE_FILE = "lean_baseline.json"
+
+TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.m4a", "*.mov"],
+}
+DEFAULT_TYPES = ["image", "font", "media"]
+DEFAULT_URL_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*segment.io*", "*intercom.io*",
+]
+
+FIREFOX_PREFS = {
+    "image": {"permissions.default.image": 2},
+    "font": {"gfx.downloadable_fonts.enabled": False},
+    "media": {"media.autoplay.default": 5, "media.autoplay.blocking_policy": 2},
+}
+
+COST_JS = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var res = performance.getEntriesByType('resource');
+var bytes = nav.transferSize || 0;
+for (var i = 0; i < res.length; i++) bytes += res[i].transferSize || 0;
+return {
+  url: location.href,
+  bytes: bytes,
+  resources: res.length,
+  load_ms: Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || 0)
+};
+"""
+
+
+def parse_list(value, default):
+    if value is None or str(value).strip() == "":
+        return list(default)
+    return [v.strip() for v in str(value).split(",") if v.strip()]
+
+
+def blocked_patterns(types, url_patterns):
+    out = []
+    for t in types:
+        # "*.png" only matches URLs that end there: cache-busted "logo.png?v=3" needs "*.png?*"
+        for pattern in TYPE_PATTERNS.get(t, []):
+            out += [pattern, f"{pattern}?*"]
+    return out + list(url_patterns)
+
+
+def apply_options(options, browser, types=DEFAULT_TYPES):
+    """Eager page loads everywhere; Firefox also gets blocking prefs."""
+    options.page_load_strategy = "eager"
+    if browser == "firefox" and hasattr(options, "set_preference"):
+        for t in types:
+            for k, v in FIREFOX_PREFS.get(t, {}).items():
+                options.set_preference(k, v)
+    return options
+
+
+def block_urls(driver, patterns) -> bool:
+    """Chromium only (CDP). Returns False when the driver can't do it."""
+    if not patterns or not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception:
+        return False
+
+
+# ---------------- Savings report ----------------
+
+def _page_key(url):
+    p = urlparse(url)
+    return f"{p.netloc}{p.path}"
+
+
+def navigation_cost(driver):
+    try:
+        cost = driver.execute_script(COST_JS)
+        return cost if isinstance(cost, dict) and cost.get("url") else None
+    except Exception:
+        return None
+
+
+class LeanReport:
+    def __init__(self, lean):
+        self.lean = lean
+        self.last_url = None
+        self.rows = []
+        self.baseline = load_json(BASELINE_FILE)
+
+    def sample(self, driver):
+        """Call after each step; measures once per new navigation."""
+        cost = navigation_cost(driver)
+        if not cost or cost["url"] == self.last_url or cost["url"].startswith(("about:", "data:")):
+            return None
+        self.last_url = cost["url"]
+        key = _page_key(cost["url"])
+        row = {"page": key, "bytes": cost["bytes"], "load_ms": cost["load_ms"]}
+        if self.lean:
+            base = self.baseline.get(key)
+            if base:
+                row["saved_bytes"] = base["bytes"] - cost["bytes"]
+                row["saved_ms"] = base["load_ms"] - cost["load_ms"]
+        else:
+            self.baseline[key] = {"bytes": cost["bytes"], "load_ms": cost["load_ms"]}
+        self.rows.append(row)
+        return row
+
+    def finish(self):
+        if not self.lean and self.rows:
+            save_json(BASELINE_FILE, self.baseline)
+        if not self.rows:
+            return
+        print(f"\n---- Navigation cost ({'lean' if self.lean else 'full, saved as baseline'}) ----")
+        for r in self.rows:
+            line = f"{r['bytes'] / 1024:9.1f} KB {r['load_ms']:7d} ms  {r['page']}"
+            if "saved_bytes" in r:
+                line += f"  (saved {r['saved_bytes'] / 1024:.1f} KB, {r['saved_ms']} ms)"
+            print(line)
+        saved = [r for r in self.rows if "saved_bytes" in r]
+        if saved:
+            print(f"Total saved: {sum(r['saved_bytes'] for r in saved) / 1024:.1f} KB, "
+                  f"{sum(r['saved_ms'] for r in saved)} ms over {len(saved)} navigations")
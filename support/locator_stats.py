@@ -0,0 +1,103 @@
+"""
+Self-learning order for fallback locator lists.
+
+Every wait_any() call with a (page, field) key records which candidate won and
+how long it took. Candidates ranked above the winner that did not match are
+penalised. Scores decay with age (half-life), so a locator that starts failing
+sinks quickly and a recovered one can climb back. Stats are keyed by
+environment (provider/browser/device) because mobile and desktop markup differ.
+
+State lives in .behave_cache/locator_stats.json and is written in after_all.
+"""
+import threading
+import time
+
+from support.cache import load_json, save_json
+
+STATS_FILE = "locator_stats.json"
+HALF_LIFE = 3 * 24 * 3600  # seconds
+MISS_PENALTY = 1.0
+
+_lock = threading.Lock()
+_state = {"env": "default", "enabled": True, "data": None, "dirty": set()}
+
+
+def configure(env="default", enabled=True):
+    with _lock:
+        _state.update(env=env or "default", enabled=enabled, data=None, dirty=set())
+
+
+def enabled():
+    return _state["enabled"]
+
+
+def candidate_id(cand) -> str:
+    if callable(cand):
+        return getattr(cand, "__name__", repr(cand))
+    by, sel = cand
+    return f"{by}={sel}"
+
+
+def _key(page, field):
+    return f"{_state['env']}|{page}|{field}"
+
+
+def _data():
+    if _state["data"] is None:
+        _state["data"] = load_json(STATS_FILE)
+    return _state["data"]
+
+
+def _decayed(entry, now):
+    age = max(0.0, now - float(entry.get("ts", now)))
+    return float(entry.get("score", 0.0)) * 0.5 ** (age / HALF_LIFE)
+
+
+def rank(page, field, candidates):
+    """Candidates sorted by decayed score; ties keep the authored order."""
+    if not _state["enabled"]:
+        return list(candidates)
+    now = time.time()
+    with _lock:
+        stats = _data().get(_key(page, field), {})
+        scores = {candidate_id(c): _decayed(stats.get(candidate_id(c), {}), now) for c in candidates}
+    return sorted(candidates, key=lambda c: -scores[candidate_id(c)])
+
+
+def record(page, field, ordered, winner, seconds):
+    """`ordered` is the order actually probed; `winner` None means a timeout."""
+    if not _state["enabled"]:
+        return
+    now = time.time()
+    with _lock:
+        key = _key(page, field)
+        stats = _data().setdefault(key, {})
+        for cand in ordered:
+            cid = candidate_id(cand)
+            entry = stats.setdefault(cid, {"score": 0.0, "ts": now})
+            score = _decayed(entry, now)
+            if winner is not None and cid == candidate_id(winner):
+                ms = seconds * 1000.0
+                prev_ms = entry.get("ms")
+                entry.update(
+                    score=score + 1.0,
+                    ms=round(ms if prev_ms is None else 0.7 * prev_ms + 0.3 * ms, 1),
+                    hits=int(entry.get("hits", 0)) + 1,
+                    ts=now,
+                )
+                break
+            # Probed before the winner (or timed out) and didn't match
+            entry.update(score=score - MISS_PENALTY, misses=int(entry.get("misses", 0)) + 1, ts=now)
+        _state["dirty"].add(key)
+
+
+def flush():
+    """Merge this process's updated keys into the file (parallel workers share it)."""
+    with _lock:
+        if not _state["dirty"] or _state["data"] is None:
+            return
+        on_disk = load_json(STATS_FILE)
+        for key in _state["dirty"]:
+            on_disk[key] = _state["data"][key]
+        save_json(STATS_FILE, on_disk)
+        _state["dirty"] = set()
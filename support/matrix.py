@@ -0,0 +1,149 @@
+"""
+Capability-matrix runner for BrowserStack (or any Selenium-compatible hub).
+
+    python -m support.matrix matrix.json -D max_sessions=5 [any other behave args]
+
+matrix.json is a list of capability sets, each made of the same -D flags
+before_all already understands:
+
+    [
+      {"name": "win-chrome", "browser": "chrome", "os": "Windows", "os_version": "11"},
+      {"browser": "safari", "os": "OS X", "os_version": "Sonoma"},
+      {"device": "Samsung Galaxy S23", "os_version": "13"}
+    ]
+
+Every set runs as its own behave process with provider=browserstack. At most
+`max_sessions` (your plan's parallel-session limit) run at once; the rest
+queue. The result grid is printed and written to reports/matrix.json.
+Point -D hub_url (or BS_HUB_URL) at support.hub_stub to try it locally.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from support.parallel import _load_report, _pop_userdata, _run_worker, _split_formats, _worker_args
+
+DEFAULT_MAX_SESSIONS = 5
+DEFAULT_OUT = "reports/matrix.json"
+LABEL_KEYS = ("device", "browser", "browser_version", "os", "os_version")
+
+
+def load_matrix(path):
+    with open(path, encoding="utf-8") as fh:
+        caps = json.load(fh)
+    if not isinstance(caps, list) or not all(isinstance(c, dict) for c in caps):
+        raise SystemExit(f"{path}: expected a JSON list of capability objects")
+    return caps
+
+
+def label_of(caps):
+    if caps.get("name"):
+        return str(caps["name"])
+    return " / ".join(str(caps[k]) for k in LABEL_KEYS if caps.get(k)) or "default"
+
+
+def _slug(label):
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in label)
+
+
+def cap_args(caps):
+    """Capability set -> behave -D flags (provider defaults to browserstack)."""
+    flags = {"provider": "browserstack", **{k: v for k, v in caps.items() if k != "name"}}
+    # The matrix checks real browsers: never let the @http tier stand in for one
+    flags["http_tier"] = False
+    out = []
+    for k, v in flags.items():
+        if isinstance(v, bool):
+            v = str(v).lower()
+        out += ["-D", f"{k}={v}"]
+    return out
+
+
+def summarize(report):
+    """{passed, failed, skipped, total} scenario counts from a behave JSON report."""
+    counts = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+    for feature in report:
+        for el in feature.get("elements", []):
+            if el.get("type") == "background":
+                continue
+            status = el.get("status", "skipped")
+            status = status if status in counts else ("failed" if status == "error" else "skipped")
+            counts[status] += 1
+            counts["total"] += 1
+    return counts
+
+
+def print_grid(rows):
+    width = max([len(r["label"]) for r in rows] + [10])
+    print(f"\n{'capability':<{width}}  {'result':<8} {'pass':>5} {'fail':>5} {'skip':>5} {'wait':>7} {'run':>7}")
+    for r in rows:
+        c = r["counts"]
+        print(f"{r['label']:<{width}}  {r['result']:<8} {c['passed']:>5} {c['failed']:>5} "
+              f"{c['skipped']:>5} {r['queued_s']:>6.1f}s {r['seconds']:>6.1f}s")
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    max_sessions = int(_pop_userdata(args, "max_sessions", os.getenv("BS_MAX_SESSIONS", DEFAULT_MAX_SESSIONS)))
+    out_path = _pop_userdata(args, "matrix_out", DEFAULT_OUT)
+    if not args or not args[0].endswith(".json"):
+        print(__doc__)
+        return 2
+    matrix = load_matrix(args.pop(0))
+    base_args, outputs = _split_formats(args)
+
+    started = time.time()
+    with tempfile.TemporaryDirectory(prefix="behave-matrix-") as tmpdir:
+        jobs = []
+        for i, caps in enumerate(matrix):
+            wargs, report = _worker_args(cap_args(caps) + base_args, outputs, i, tmpdir)
+            jobs.append({"index": i, "caps": caps, "args": wargs, "report": report})
+
+        def run(job):
+            # Time spent waiting for a free session slot vs. actually running
+            queued = time.time() - started
+            res = _run_worker(job["index"], job["args"], [])
+            counts = summarize(_load_report(job["report"]))
+            if res["code"] == 0:
+                result = "passed"
+            else:
+                result = "failed" if counts["total"] else "error"
+            return {**res, "label": label_of(job["caps"]), "caps": job["caps"],
+                    "counts": counts, "result": result, "queued_s": queued}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_sessions)) as pool:
+            rows = list(pool.map(run, jobs))
+
+    # Worker-suffixed outputs -> one file per capability
+    for fmt, outfile in outputs:
+        if outfile is None or "allure" in fmt.lower():
+            continue
+        for r in rows:
+            part = Path(f"{outfile}.worker{r['worker']}")
+            if part.exists():
+                part.replace(f"{outfile}.{_slug(r['label'])}")
+
+    for r in rows:
+        if r["result"] != "passed":
+            print(f"===== {r['label']} (exit {r['code']}) =====")
+            sys.stdout.write(r["stdout"][-4000:])
+            if r["stderr"]:
+                sys.stderr.write(r["stderr"][-4000:])
+
+    print_grid(rows)
+    print(f"Matrix: {len(rows)} capability sets, max {max_sessions} concurrent, "
+          f"{time.time() - started:.1f}s total")
+
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump([{k: r[k] for k in ("label", "caps", "result", "counts", "code", "queued_s", "seconds")}
+                   for r in rows], fh, indent=2)
+    return max(r["code"] for r in rows)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Parallel behave runner.
+
+    python -m support.parallel -D workers=4 [any other behave args]
+
+Scenarios are split across N behave worker processes. Every worker runs the
+normal hooks in features/environment.py, so each one builds its own driver
+from the same provider/browser flags. Scenarios are scheduled longest-first
+using durations from earlier runs, and worker output is merged back into a
+single console report / JSON report / Allure results directory.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from support.cache import load_json, save_json
+
+DURATIONS_FILE = "durations.json"
+DEFAULT_DURATION = 30.0   # seconds, for scenarios we have never timed
+FEATURES_DIR = "features/tests"
+
+
+# ---------------- Args ----------------
+
+def _pop_userdata(args, key, default=None):
+    """Remove `-D key=value` from args (runner-only option) and return value."""
+    out, value, i = [], default, 0
+    while i < len(args):
+        a = args[i]
+        if a in ("-D", "--define") and i + 1 < len(args) and args[i + 1].startswith(f"{key}="):
+            value = args[i + 1].split("=", 1)[1]
+            i += 2
+            continue
+        if a.startswith(f"-D{key}=") or a.startswith(f"--define={key}="):
+            value = a.split("=", 2)[-1]
+            i += 1
+            continue
+        out.append(a)
+        i += 1
+    args[:] = out
+    return value
+
+
+def _split_formats(args):
+    """
+    Pull -f/-o pairs out of args. Returns (rest, [(format, outfile|None), ...]).
+    behave pairs the i-th outfile with the i-th format; the rest go to stdout.
+    """
+    rest, formats, outfiles, i = [], [], [], 0
+    while i < len(args):
+        a = args[i]
+        if a in ("-f", "--format") and i + 1 < len(args):
+            formats.append(args[i + 1]); i += 2; continue
+        if a in ("-o", "--outfile") and i + 1 < len(args):
+            outfiles.append(args[i + 1]); i += 2; continue
+        if a.startswith("--format="):
+            formats.append(a.split("=", 1)[1]); i += 1; continue
+        if a.startswith("--outfile="):
+            outfiles.append(a.split("=", 1)[1]); i += 1; continue
+        rest.append(a)
+        i += 1
+    pairs = [(f, outfiles[n] if n < len(outfiles) else None) for n, f in enumerate(formats)]
+    return rest, pairs
+
+
+def _split_paths(args):
+    """Positional feature paths vs. everything else."""
+    paths, rest, i = [], [], 0
+    takes_value = {"-D", "--define", "-t", "--tags", "-n", "--name", "-i", "--include",
+                   "-e", "--exclude", "--lang", "--logging-level", "--junit-directory",
+                   "-f", "--format", "-o", "--outfile"}
+    while i < len(args):
+        a = args[i]
+        if a in takes_value and i + 1 < len(args):
+            rest += [a, args[i + 1]]; i += 2; continue
+        if not a.startswith("-") and (a.endswith(".feature") or os.path.isdir(a) or ":" in a):
+            paths.append(a)
+        else:
+            rest.append(a)
+        i += 1
+    return paths, rest
+
+
+# ---------------- Scenario collection ----------------
+
+def scenario_key(feature_file, scenario_name) -> str:
+    return f"{Path(feature_file).as_posix()}::{scenario_name}"
+
+
+def _selection_config(args):
+    """behave's own Configuration for -t/-n/-i/-e (and behave.ini defaults)."""
+    from behave.configuration import Configuration
+    return Configuration(command_args=list(args or []))
+
+
+def collect_scenarios(paths=None, args=None):
+    """
+    Return [(key, "file:line")] for every scenario under the given paths that
+    the behave `args` (tags, name, include/exclude) would select.
+    """
+    from behave.parser import parse_file
+
+    config = _selection_config(args)
+
+    files = []   # [(path, only_line|None)]
+    for p in (paths or [FEATURES_DIR]):
+        only_line = None
+        if ".feature:" in p:
+            p, only_line = p.rsplit(":", 1)
+            only_line = int(only_line)
+        path = Path(p)
+        if path.is_dir():
+            files += [(f, None) for f in sorted(path.rglob("*.feature"))]
+        elif path.suffix == ".feature":
+            files.append((path, only_line))
+    found = []
+    for f, only_line in files:
+        if config.exclude(str(f)):
+            continue
+        feature = parse_file(str(f))
+        if feature is None:
+            continue
+        for sc in feature.scenarios:
+            if only_line is not None and sc.line != only_line:
+                continue
+            # Same decision the worker makes; unselected ones would only skew the plan
+            if not sc.should_run(config):
+                continue
+            found.append((scenario_key(f, sc.name), f"{Path(f).as_posix()}:{sc.line}"))
+    return found
+
+
+# ---------------- Scheduling ----------------
+
+def plan(scenarios, workers, durations):
+    """
+    Longest-processing-time-first: sort by past duration (desc), then always
+    hand the next scenario to the least-loaded worker.
+    """
+    known = [durations[k] for k, _ in scenarios if k in durations]
+    fallback = (sum(known) / len(known)) if known else DEFAULT_DURATION
+    ordered = sorted(scenarios, key=lambda s: durations.get(s[0], fallback), reverse=True)
+    buckets = [{"load": 0.0, "locations": []} for _ in range(max(1, workers))]
+    for key, location in ordered:
+        b = min(buckets, key=lambda x: x["load"])
+        b["locations"].append(location)
+        b["load"] += durations.get(key, fallback)
+    return [b for b in buckets if b["locations"]]
+
+
+# ---------------- Report merging ----------------
+
+def _is_json_format(fmt):
+    return fmt.split(":", 1)[0] in ("json", "json.pretty")
+
+
+def _is_allure_format(fmt):
+    return "allure" in fmt.lower()
+
+
+def _load_report(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh) or []
+    except Exception:
+        return []
+
+
+def merge_json_reports(paths):
+    """Merge behave JSON reports; scenarios of the same feature end up together."""
+    merged, by_location = [], {}
+    for path in paths:
+        for feature in _load_report(path):
+            loc = feature.get("location", "").split(":", 1)[0]
+            if loc in by_location:
+                by_location[loc].setdefault("elements", []).extend(feature.get("elements", []))
+            else:
+                by_location[loc] = feature
+                merged.append(feature)
+    for feature in merged:
+        feature.get("elements", []).sort(
+            key=lambda e: int(str(e.get("location", ":0")).rsplit(":", 1)[-1] or 0)
+        )
+    return merged
+
+
+def update_durations(report, durations, alpha=0.5):
+    """Exponentially-weighted moving average of scenario wall time."""
+    for feature in report:
+        ffile = feature.get("location", "").split(":", 1)[0]
+        for el in feature.get("elements", []):
+            if el.get("type") == "background" or el.get("status") in ("untested", "skipped"):
+                continue
+            total = sum(
+                float((s.get("result") or {}).get("duration") or 0.0) for s in el.get("steps", [])
+            )
+            key = scenario_key(ffile, el.get("name", ""))
+            prev = durations.get(key)
+            durations[key] = round(total if prev is None else alpha * total + (1 - alpha) * prev, 3)
+    return durations
+
+
+# ---------------- Runner ----------------
+
+def _worker_args(base_args, outputs, worker_id, tmpdir):
+    """Per-worker behave args: private timing report + user outputs made worker-safe."""
+    timing = str(Path(tmpdir) / f"timing-{worker_id}.json")
+    args = ["-f", "json", "-o", timing]
+    stdout_formats = []
+    for fmt, outfile in outputs:
+        if outfile is None:
+            stdout_formats.append(fmt)
+        elif _is_allure_format(fmt):
+            # Allure results are one file per test: workers can share the dir.
+            args += ["-f", fmt, "-o", outfile]
+        else:
+            args += ["-f", fmt, "-o", f"{outfile}.worker{worker_id}"]
+    for fmt in (stdout_formats or ["pretty"]):
+        args += ["-f", fmt]
+    return args + base_args, timing
+
+
+def _run_worker(worker_id, args, locations):
+    env = dict(os.environ, BEHAVE_WORKER=str(worker_id))
+    cmd = [sys.executable, "-m", "behave", *args, *locations]
+    started = time.time()
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    return {
+        "worker": worker_id,
+        "code": proc.returncode,
+        "stdout": proc.stdout,
+        "stderr": proc.stderr,
+        "seconds": time.time() - started,
+    }
+
+
+def _merge_outputs(outputs, n_workers):
+    for fmt, outfile in outputs:
+        if outfile is None or _is_allure_format(fmt):
+            continue
+        parts = [f"{outfile}.worker{i}" for i in range(n_workers)]
+        if _is_json_format(fmt):
+            merged = merge_json_reports(parts)
+            with open(outfile, "w", encoding="utf-8") as fh:
+                json.dump(merged, fh, indent=2 if fmt == "json.pretty" else None)
+        else:
+            with open(outfile, "w", encoding="utf-8") as out:
+                for p in parts:
+                    try:
+                        out.write(Path(p).read_text(encoding="utf-8"))
+                    except Exception:
+                        pass
+        for p in parts:
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    workers = int(_pop_userdata(args, "workers", os.getenv("WORKERS", "1")) or 1)
+    # Formats first: "module:Class" formatter names would look like feature paths
+    args, outputs = _split_formats(args)
+    paths, base_args = _split_paths(args)
+
+    scenarios = collect_scenarios(paths, base_args)
+    durations = load_json(DURATIONS_FILE)
+    buckets = plan(scenarios, workers, durations)
+    if not buckets:
+        print("No scenarios found.")
+        return 0
+
+    started = time.time()
+    with tempfile.TemporaryDirectory(prefix="behave-par-") as tmpdir:
+        jobs = []
+        for i, bucket in enumerate(buckets):
+            wargs, timing = _worker_args(base_args, outputs, i, tmpdir)
+            jobs.append((i, wargs, bucket["locations"], timing))
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            results = list(pool.map(lambda j: _run_worker(*j[:3]), jobs))
+
+        timings = [j[3] for j in jobs]
+        update_durations(merge_json_reports(timings), durations)
+        save_json(DURATIONS_FILE, durations)
+
+    _merge_outputs(outputs, len(jobs))
+
+    for r in results:
+        print(f"===== worker {r['worker']} ({r['seconds']:.1f}s, exit {r['code']}) =====")
+        sys.stdout.write(r["stdout"])
+        if r["code"] != 0 and r["stderr"]:
+            sys.stderr.write(r["stderr"])
+    print(f"Parallel run: {len(scenarios)} scenarios on {len(jobs)} workers "
+          f"in {time.time() - started:.1f}s")
+    return max(r["code"] for r in results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Prewarmed browser profile template (-D profile_template=true, local only).
+
+Local sessions normally start from an empty temp profile, so the first
+Reelly navigation pays for a cold HTTP cache, DNS, service-worker install
+and first-run work. Build a warmed profile once:
+
+    python -m support.profiles build --browser chrome [--url https://soft.reelly.io/auth/sign-up ...]
+
+Each session then gets a private copy on tmpfs (/dev/shm when available),
+made with `cp --reflink=auto` so copy-on-write filesystems share blocks.
+The copy is passed via --user-data-dir (Chrome) or -profile (Firefox) and
+deleted in after_all. A template built for another browser major version is
+ignored.
+
+    python -m support.profiles measure --browser chrome --runs 3
+
+launches fresh sessions with and without the template and reports
+time-to-first-landmark (session start -> sign-up form visible).
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from support.cache import cache_path, load_json, save_json
+
+TEMPLATE_ROOT = cache_path("profile-template")
+META_FILE = "profile_template.json"
+DEFAULT_URLS = [
+    "https://soft.reelly.io/auth/sign-up",
+    "https://find.reelly.io/",
+    "https://www.google.com/?hl=en&gl=us",
+]
+# Per-process locks a running browser leaves behind; a copy must not inherit them
+LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lock", ".parentlock", "parent.lock")
+FIRST_RUN_ARGS = ["--no-first-run", "--no-default-browser-check", "--disable-search-engine-choice-screen"]
+
+
+def tmp_root() -> Path:
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+def template_dir(browser) -> Path:
+    return TEMPLATE_ROOT / browser
+
+
+def _major(version):
+    return (version or "").split(".", 1)[0]
+
+
+def template_ready(browser) -> bool:
+    """Template exists and was built with the installed browser major version."""
+    from support.driver_paths import browser_version
+
+    meta = load_json(META_FILE).get(browser)
+    if not meta or not template_dir(browser).is_dir():
+        return False
+    installed = browser_version(browser)
+    return not installed or _major(installed) == _major(meta.get("version"))
+
+
+def apply_profile(options, browser, path):
+    if browser == "firefox":
+        options.add_argument("-profile")
+        options.add_argument(str(path))
+    else:
+        options.add_argument(f"--user-data-dir={path}")
+        for arg in FIRST_RUN_ARGS:
+            options.add_argument(arg)
+    return options
+
+
+def clone(browser) -> Path:
+    """Private copy of the template on tmpfs; copy-on-write where supported."""
+    src = template_dir(browser)
+    dest = tmp_root() / f"behave-profile-{browser}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    try:
+        subprocess.run(["cp", "-a", "--reflink=auto", str(src), str(dest)],
+                       check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(dest, ignore_errors=True)
+        shutil.copytree(src, dest, symlinks=True)
+    # os.walk also lists dangling symlinks (Chrome's SingletonLock is one)
+    for root, _dirs, files in os.walk(dest):
+        for name in files:
+            if name in LOCK_FILES:
+                try:
+                    os.unlink(os.path.join(root, name))
+                except OSError:
+                    pass
+    return dest
+
+
+def discard(path):
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# ---------------- Build / measure ----------------
+
+def launch_local(browser, headless=True, profile=None):
+    """Local driver like before_all's, optionally on a given profile dir."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+
+    from support.browsers import local_chrome_options, local_firefox_options
+    from support.driver_paths import resolve_driver_path
+
+    if browser == "firefox":
+        options = local_firefox_options(headless)
+        if profile:
+            apply_profile(options, browser, profile)
+        return webdriver.Firefox(service=FirefoxService(resolve_driver_path("firefox")), options=options)
+    options = local_chrome_options(headless)
+    if profile:
+        apply_profile(options, browser, profile)
+    return webdriver.Chrome(service=ChromeService(resolve_driver_path("chrome")), options=options)
+
+
+def build(browser, urls, headless=True, settle=3.0):
+    from support.driver_paths import browser_version
+
+    target = template_dir(browser)
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True, exist_ok=True)
+    driver = launch_local(browser, headless, target)
+    try:
+        for url in urls:
+            started = time.perf_counter()
+            driver.get(url)
+            # Give service workers / lazy assets a moment to land in the cache
+            time.sleep(settle)
+            print(f"  warmed {url} ({time.perf_counter() - started:.1f}s)")
+    finally:
+        driver.quit()
+    meta = load_json(META_FILE)
+    meta[browser] = {"version": browser_version(browser), "urls": list(urls), "ts": time.time()}
+    save_json(META_FILE, meta)
+    return target
+
+
+def time_to_landmark(browser, url, headless=True, use_template=False, timeout=60):
+    from pages import locators
+    from support.waits import wait_any
+
+    profile = clone(browser) if use_template else None
+    started = time.perf_counter()
+    driver = launch_local(browser, headless, profile)
+    try:
+        session = time.perf_counter() - started
+        driver.get(url)
+        wait_any(driver, locators.get("sign_up", "full_name"), "visible", timeout)
+        return session, time.perf_counter() - started
+    finally:
+        driver.quit()
+        discard(profile)
+
+
+def measure(browser, url, runs=3, headless=True):
+    rows = {}
+    for label, use_template in (("empty profile", False), ("template copy", True)):
+        samples = [time_to_landmark(browser, url, headless, use_template) for _ in range(runs)]
+        rows[label] = samples
+        avg_session = sum(s for s, _ in samples) / runs
+        avg_total = sum(t for _, t in samples) / runs
+        print(f"{label:>14}: session {avg_session:5.2f}s, first landmark {avg_total:5.2f}s (avg of {runs})")
+    base = sum(t for _, t in rows["empty profile"]) / runs
+    warm = sum(t for _, t in rows["template copy"]) / runs
+    print(f"Template saves {base - warm:.2f}s to first landmark ({(base - warm) / base:.0%})")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.profiles")
+    parser.add_argument("command", choices=["build", "measure", "status"])
+    parser.add_argument("--browser", default="chrome", choices=["chrome", "firefox"])
+    parser.add_argument("--url", action="append", help="page(s) to warm / measure")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    headless = not args.headed
+
+    if args.command == "build":
+        path = build(args.browser, args.url or DEFAULT_URLS, headless)
+        print(f"Template ready: {path}")
+    elif args.command == "measure":
+        if not template_ready(args.browser):
+            print(f"No usable {args.browser} template; run `python -m support.profiles build` first.")
+            return 1
+        measure(args.browser, (args.url or DEFAULT_URLS)[0], args.runs, headless)
+    else:
+        meta = load_json(META_FILE).get(args.browser)
+        print(f"{args.browser}: {'ready' if template_ready(args.browser) else 'missing/stale'} {meta or ''}")
+        print(f"copies go to {tmp_root()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Session provider registry (-D provider=...).
+
+A provider is a callable `start(spec)` that returns the new WebDriver, or a
+dict with "driver" plus any session state environment.py has to keep
+("warm_lease", "profile_copy"). Built-ins are named "module:attr" strings, so
+only the provider a run selects is imported:
+
+    local          support.providers.local         (Chrome / Firefox on this machine)
+    browserstack   support.providers.browserstack  (aliases: bs, remote)
+    warm           support.providers.warm          (session from support.warm_pool)
+
+Other packages add providers via the "reelly_behave.providers" entry-point
+group, e.g. in their pyproject.toml:
+
+    [project.entry-points."reelly_behave.providers"]
+    lambdatest = "my_pkg.lambdatest:start"
+
+-D startup_profile=true prints how long each step of startup took: importing
+environment.py, importing the provider and creating its session.
+"""
+import importlib
+import time
+from importlib import metadata
+
+ENTRY_POINT_GROUP = "reelly_behave.providers"
+BUILTIN = {
+    "local": "support.providers.local:start",
+    "browserstack": "support.providers.browserstack:start",
+    "warm": "support.providers.warm:start",
+}
+ALIASES = {"": "local", "bs": "browserstack", "remote": "browserstack"}
+
+_profile = []   # (seconds, label)
+
+
+class SessionSpec:
+    """What a provider needs from the -D flags; `get` reads provider-specific ones."""
+
+    def __init__(self, get, browser="chrome", headless=False, mobile="", lean_types=None, isolation="off"):
+        self.get = get                # get(key, default) -> -D value or ENV
+        self.browser = browser
+        self.headless = headless
+        self.mobile = mobile          # local Chrome mobile emulation device name
+        self.lean_types = lean_types  # None unless -D lean=true
+        self.isolation = isolation
+
+    def flag(self, key, default=False):
+        v = self.get(key, None)
+        if v is None:
+            return default
+        return str(v).strip().lower() in ("1", "true", "yes", "y", "on")
+
+
+def canonical(name):
+    name = (name or "").lower()
+    return ALIASES.get(name, name)
+
+
+def _plugins():
+    try:
+        eps = metadata.entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        eps = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+    return {ep.name: ep for ep in eps}
+
+
+def resolve(name):
+    """Import and return the provider's start callable."""
+    name = canonical(name)
+    started = time.perf_counter()
+    if name in BUILTIN:
+        module, _, attr = BUILTIN[name].partition(":")
+        start = getattr(importlib.import_module(module), attr)
+    else:
+        plugins = _plugins()
+        if name not in plugins:
+            raise ValueError(f"Unknown provider {name!r}; built-in: {sorted(BUILTIN)}, "
+                             f"plugins: {sorted(plugins) or 'none installed'}")
+        start = plugins[name].load()
+    record(f"import provider {name}", time.perf_counter() - started)
+    return start
+
+
+def start_session(name, spec):
+    """{"driver": ..., "session_seconds": ..., plus provider state}."""
+    start = resolve(name)
+    started = time.perf_counter()
+    result = start(spec)
+    if not isinstance(result, dict):
+        result = {"driver": result}
+    seconds = time.perf_counter() - started
+    record(f"session {canonical(name)}/{spec.browser}", seconds)
+    result["session_seconds"] = seconds
+    return result
+
+
+def apply_common(options, browser, spec):
+    """Lean loading and BiDi user contexts apply to every provider's options."""
+    if spec.lean_types is not None:
+        from support import lean
+        lean.apply_options(options, browser, spec.lean_types)
+    if spec.isolation == "bidi":
+        from support import isolation
+        isolation.request_bidi(options)
+    return options
+
+
+# ---- startup profile ----
+
+def record(label, seconds):
+    _profile.append((seconds, label))
+
+
+def print_profile():
+    if not _profile:
+        return
+    print("\n---- Startup profile ----")
+    for seconds, label in _profile:
+        print(f"{seconds:8.3f}s  {label}")
+    print(f"{sum(s for s, _ in _profile):8.3f}s  total")
+    _profile.clear()
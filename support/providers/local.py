@@ -0,0 +1,53 @@
+"""Local Chrome / Firefox; only the selected browser's Selenium modules are imported."""
+from support import profiles
+from support.driver_paths import resolve_driver_path
+from support.providers import apply_common
+
+
+def _chrome(spec, offline, profile_copy):
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.chrome.webdriver import WebDriver as Chrome
+
+    from support.browsers import local_chrome_options
+
+    # Apply Chrome mobile emulation if requested
+    options = local_chrome_options(spec.headless, spec.mobile)
+    if profile_copy:
+        profiles.apply_profile(options, "chrome", profile_copy)
+    apply_common(options, "chrome", spec)
+    service = ChromeService(resolve_driver_path("chrome", offline=offline))
+    return Chrome(service=service, options=options)
+
+
+def _firefox(spec, offline, profile_copy):
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.firefox.webdriver import WebDriver as Firefox
+
+    from support.browsers import local_firefox_options
+
+    options = local_firefox_options(spec.headless)
+    if profile_copy:
+        profiles.apply_profile(options, "firefox", profile_copy)
+    apply_common(options, "firefox", spec)
+    service = FirefoxService(resolve_driver_path("firefox", offline=offline))
+    return Firefox(service=service, options=options)
+
+
+def start(spec):
+    # Driver path comes from the version-keyed cache (no network on warm starts)
+    offline = spec.flag("driver_offline")
+    target = "firefox" if spec.browser == "firefox" else "chrome"
+    # Warmed profile template: private copy per session, removed when it ends
+    profile_copy = None
+    if spec.flag("profile_template"):
+        if profiles.template_ready(target):
+            profile_copy = profiles.clone(target)
+        else:
+            print(f"[INFO] No usable {target} profile template; starting from an empty profile.")
+    launch = _firefox if target == "firefox" else _chrome
+    try:
+        driver = launch(spec, offline, profile_copy)
+    except Exception:
+        profiles.discard(profile_copy)
+        raise
+    return {"driver": driver, "profile_copy": profile_copy}
@@ -0,0 +1,8 @@
+"""Attach to an already-running session from `python -m support.warm_pool serve`."""
+from support import warm_pool
+
+
+def start(spec):
+    pool_url = spec.get("warm_url", warm_pool.DEFAULT_URL)
+    lease = warm_pool.checkout(pool_url, browser=spec.browser)
+    return {"driver": warm_pool.attach(lease), "warm_lease": (pool_url, lease)}
@@ -0,0 +1,116 @@
+"""
+Browser resource monitor with session recycling.
+
+After each scenario the monitor samples:
+  - RSS and CPU time of the driver process and all its children (the browser),
+    via psutil when it is installed and the driver is local
+  - the JS heap via performance.memory (Chromium), over WebDriver
+
+before_scenario recycles the session (quit + fresh driver) once a limit is
+exceeded:
+  -D max_rss_mb=1500  -D max_heap_mb=500  -D max_scenarios_per_session=20
+
+Per-scenario usage and recycles are printed in the run summary
+(-D resource_monitor=true prints it without any limits set).
+"""
+try:
+    import psutil
+except ImportError:  # optional: heap-only monitoring without it
+    psutil = None
+
+HEAP_JS = """
+var m = window.performance && performance.memory;
+return m ? m.usedJSHeapSize : null;
+"""
+MB = 1024 * 1024
+
+
+def _process_tree(driver):
+    service = getattr(driver, "service", None)
+    proc = getattr(service, "process", None)
+    if psutil is None or proc is None:
+        return []
+    try:
+        root = psutil.Process(proc.pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def sample(driver):
+    """{"rss_mb", "cpu_s", "heap_mb"}; values are None when unavailable."""
+    rss = cpu = None
+    procs = _process_tree(driver)
+    if procs:
+        rss = cpu = 0.0
+        for p in procs:
+            try:
+                rss += p.memory_info().rss / MB
+                t = p.cpu_times()
+                cpu += t.user + t.system
+            except psutil.Error:
+                continue  # process exited between listing and sampling
+    heap = None
+    try:
+        used = driver.execute_script(HEAP_JS)
+        heap = used / MB if used else None
+    except Exception:
+        pass
+    return {"rss_mb": rss, "cpu_s": cpu, "heap_mb": heap}
+
+
+class ResourceMonitor:
+    def __init__(self, max_rss_mb=None, max_heap_mb=None, max_scenarios=None):
+        self.max_rss_mb = max_rss_mb
+        self.max_heap_mb = max_heap_mb
+        self.max_scenarios = max_scenarios
+        self.rows = []
+        self.recycles = []      # (reason, seconds)
+        self.in_session = 0
+        self.last = None
+        self._cpu_base = None
+
+    def session_started(self, driver):
+        self.in_session = 0
+        self.last = None
+        self._cpu_base = sample(driver)["cpu_s"]
+
+    def after_scenario(self, name, driver):
+        s = sample(driver)
+        cpu = None
+        if s["cpu_s"] is not None and self._cpu_base is not None:
+            cpu = max(0.0, s["cpu_s"] - self._cpu_base)
+            self._cpu_base = s["cpu_s"]
+        self.in_session += 1
+        self.last = s
+        self.rows.append({"scenario": name, "rss_mb": s["rss_mb"], "heap_mb": s["heap_mb"],
+                          "cpu_s": cpu, "session_scenarios": self.in_session})
+        return s
+
+    def recycle_reason(self):
+        """Why the session should be replaced before the next scenario, or None."""
+        s = self.last or {}
+        if self.max_scenarios and self.in_session >= self.max_scenarios:
+            return f"{self.in_session}/{self.max_scenarios} scenarios per session"
+        if self.max_rss_mb and s.get("rss_mb") and s["rss_mb"] > self.max_rss_mb:
+            return f"RSS {s['rss_mb']:.0f} MB > {self.max_rss_mb:g} MB"
+        if self.max_heap_mb and s.get("heap_mb") and s["heap_mb"] > self.max_heap_mb:
+            return f"JS heap {s['heap_mb']:.0f} MB > {self.max_heap_mb:g} MB"
+        return None
+
+    def recycled(self, reason, seconds):
+        self.recycles.append((reason, seconds))
+
+    def print_summary(self):
+        if not self.rows:
+            return
+        fmt = lambda v, spec: format(v, spec) if v is not None else "-"
+        print("\n---- Browser resources per scenario ----")
+        print(f"{'RSS MB':>8} {'heap MB':>8} {'CPU s':>7}  scenario")
+        for r in self.rows:
+            print(f"{fmt(r['rss_mb'], '8.0f'):>8} {fmt(r['heap_mb'], '8.1f'):>8} "
+                  f"{fmt(r['cpu_s'], '7.2f'):>7}  {r['scenario']}")
+        if psutil is None:
+            print("(install psutil for RSS/CPU of the browser process tree)")
+        for reason, seconds in self.recycles:
+            print(f"Recycled session ({reason}) in {seconds:.1f}s")
@@ -0,0 +1,90 @@
+"""
+HTTP-level pre-resolution of candidate routes.
+
+Instead of loading every candidate auth URL in the browser and checking for a
+404 after each, probe them concurrently with a plain HTTP client and pick the
+first (in preference order) that is not a 404. The winner is cached per base
+URL with a TTL, so later runs make exactly one browser navigation.
+"""
+import re
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from support.cache import is_fresh, load_json, save_json
+
+ROUTES_FILE = "routes.json"
+DEFAULT_TTL = 24 * 3600  # seconds
+PROBE_TIMEOUT = 8
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+NOT_FOUND_SIGNS = ["404", "not found", "doesn’t exist", "does not exist", "page not found"]
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+
+
+def fetch(url, timeout=PROBE_TIMEOUT, method="GET"):
+    """(status, final_url, html) following redirects; status 0 on network error."""
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT}, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            body = resp.read(512 * 1024).decode("utf-8", "replace")
+            return resp.status, resp.geturl(), body
+    except urllib.error.HTTPError as e:
+        return e.code, e.geturl() or url, ""
+    except Exception:
+        return 0, url, ""
+
+
+def html_title(html) -> str:
+    m = _TITLE_RE.search(html or "")
+    return re.sub(r"\s+", " ", m.group(1)).strip() if m else ""
+
+
+def probe(url, timeout=PROBE_TIMEOUT):
+    status, final_url, html = fetch(url, timeout)
+    title = html_title(html).lower()
+    ok = 200 <= status < 400 and not any(s in title for s in NOT_FOUND_SIGNS)
+    return {"url": url, "ok": ok, "status": status, "final_url": final_url, "title": title}
+
+
+def resolve_route(base, candidates, ttl=DEFAULT_TTL, timeout=PROBE_TIMEOUT):
+    """First non-404 candidate (cached per base), or None if none qualifies."""
+    # Fragments never reach the server: "/#/auth/sign-up" would probe the base
+    # URL and win for any SPA, so hash-router candidates are left to the browser.
+    candidates = [c for c in candidates if not urlsplit(c).fragment]
+    cache = load_json(ROUTES_FILE)
+    entry = cache.get(base)
+    if entry and is_fresh(entry, ttl) and entry.get("url") in candidates:
+        return entry["url"]
+    if not candidates:
+        return None
+
+    winner = None
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [pool.submit(probe, url, timeout) for url in candidates]
+        # All probes run concurrently; take results in preference order.
+        for fut in futures:
+            if fut.result()["ok"]:
+                winner = fut.result()["url"]
+                break
+    finally:
+        # Don't wait for slower, less preferred probes once a winner is known
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if winner:
+        cache[base] = {"url": winner, "ts": time.time()}
+        save_json(ROUTES_FILE, cache)
+    return winner
+
+
+def invalidate_route(base):
+    cache = load_json(ROUTES_FILE)
+    if cache.pop(base, None) is not None:
+        save_json(ROUTES_FILE, cache)
@@ -0,0 +1,303 @@
+"""
+Change-aware scenario selection.
+
+    python -m support.selection [--list] [--all] [behave args]
+    python -m support.selection --mark-green
+
+Every scenario is mapped to the files it can exercise:
+
+- its feature file
+- the step definitions its steps match (behave's own matcher)
+- whatever those step modules import from this repo (pages/, app/, support/),
+  followed transitively through the AST import graph
+- app/application.py plus the page module behind every `context.app.<attr>`
+  the step function (or a same-file helper it calls) touches
+
+Files are hashed and compared with the hashes recorded after the last green
+run. Only scenarios whose files changed are handed to behave, and a passing run
+becomes the new baseline. With no baseline, or when features/environment.py or
+anything it imports (other than page objects behind app/application.py, plus
+the built-in providers it loads by name) changed, everything runs.
+
+The scenario -> step definition part needs the step modules loaded, so it is
+cached in .behave_cache/selection_map.json, keyed by the hashes of the step
+and feature files. The import graph is cheap and is rebuilt on every call.
+"""
+import ast
+import hashlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from support.cache import load_json, save_json
+from support.parallel import FEATURES_DIR, collect_scenarios
+
+MAP_FILE = "selection_map.json"
+GREEN_FILE = "green_run.json"
+ROOT = Path(".")
+STEPS_DIR = Path("features/steps")
+ENVIRONMENT = Path("features/environment.py")
+APPLICATION = Path("app/application.py")
+SOURCE_DIRS = ("app", "pages", "support", "features")
+
+
+def _posix(path):
+    return Path(path).as_posix()
+
+
+def file_hash(path):
+    try:
+        return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def tracked_files():
+    files = []
+    for d in SOURCE_DIRS:
+        files += [p for p in Path(d).rglob("*.py") if "__pycache__" not in p.parts]
+        files += list(Path(d).rglob("*.feature"))
+    return sorted(_posix(p) for p in files)
+
+
+def tree_hashes():
+    return {f: file_hash(f) for f in tracked_files()}
+
+
+# ---------------- Import graph ----------------
+
+def _module_file(name):
+    """'pages.sign_up_page' -> 'pages/sign_up_page.py' (repo modules only)."""
+    base = Path(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return _posix(candidate)
+    return None
+
+
+def imports_of(path):
+    """Repo-local files imported by one module."""
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return set()
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            # `from support import timeouts` may name a submodule
+            names = [node.module] + [f"{node.module}.{a.name}" for a in node.names]
+        else:
+            continue
+        for name in names:
+            f = _module_file(name)
+            if f and f != _posix(path):
+                found.add(f)
+    return found
+
+
+def closure(paths, stop=()):
+    """Files reachable from `paths`; modules in `stop` are included but not followed."""
+    seen, todo = set(), list(paths)
+    while todo:
+        p = todo.pop()
+        if p in seen:
+            continue
+        seen.add(p)
+        if p not in stop:
+            todo += imports_of(p) - seen
+    return seen
+
+
+def provider_modules():
+    """Built-in session providers: imported by name at runtime, invisible to the AST."""
+    from support.providers import BUILTIN
+
+    files = (_module_file(target.partition(":")[0]) for target in BUILTIN.values())
+    return sorted(f for f in files if f)
+
+
+def app_attributes():
+    """{'sign_up_page': 'pages/sign_up_page.py'} from Application.__init__."""
+    try:
+        tree = ast.parse(APPLICATION.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return {}
+    class_files = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for a in node.names:
+                f = _module_file(node.module)
+                if f:
+                    class_files[a.asname or a.name] = f
+    attrs = {}
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)):
+            for t in node.targets:
+                if isinstance(t, ast.Attribute) and isinstance(t.value, ast.Name) and t.value.id == "self":
+                    if node.value.func.id in class_files:
+                        attrs[t.attr] = class_files[node.value.func.id]
+    return attrs
+
+
+def app_attrs_used(path, line):
+    """
+    `context.app.<attr>` names used by the step function defined at `line`,
+    including module-level helpers of the same file that it (transitively) calls.
+    """
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return set()
+    helpers = {fn.name: fn for fn in tree.body if isinstance(fn, ast.FunctionDef)}
+    step = next((fn for fn in ast.walk(tree) if isinstance(fn, ast.FunctionDef)
+                 and line in [d.lineno for d in fn.decorator_list] + [fn.lineno]), None)
+    used, seen, todo = set(), set(), [step] if step else []
+    while todo:
+        fn = todo.pop()
+        if fn in seen:
+            continue
+        seen.add(fn)
+        for node in ast.walk(fn):
+            if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Attribute)
+                    and node.value.attr == "app"):
+                used.add(node.attr)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in helpers:
+                todo.append(helpers[node.func.id])
+    return used
+
+
+# ---------------- Scenario -> step definitions (cached) ----------------
+
+def _map_key():
+    files = sorted(_posix(p) for p in STEPS_DIR.glob("*.py"))
+    files += sorted(_posix(p) for p in Path(FEATURES_DIR).rglob("*.feature"))
+    h = hashlib.sha1()
+    for f in files:
+        h.update(f.encode())
+        h.update((file_hash(f) or "").encode())
+    return h.hexdigest()
+
+
+def _build_step_map():
+    """{scenario_key: {"location", "feature", "step_defs": [[file, line], ...]}}"""
+    from behave.parser import parse_file
+    from behave.runner_util import load_step_modules
+    from behave.step_registry import registry
+
+    if str(ROOT.resolve()) not in sys.path:
+        sys.path.insert(0, str(ROOT.resolve()))
+    registry.clear()
+    load_step_modules([str(STEPS_DIR)])
+
+    out = {}
+    for key, location in collect_scenarios([FEATURES_DIR]):
+        feature_file, line = location.rsplit(":", 1)
+        feature = parse_file(feature_file)
+        scenario = next((s for s in feature.scenarios if s.line == int(line)), None)
+        steps = list(feature.background.steps if feature.background else []) + list(scenario.steps)
+        defs = set()
+        for step in steps:
+            match = registry.find_match(step)
+            if match is not None:
+                loc = match.location
+                defs.add((_posix(Path(loc.filename).resolve().relative_to(ROOT.resolve())), loc.line))
+        out[key] = {"location": location, "feature": feature_file, "step_defs": sorted(defs)}
+    return out
+
+
+def step_map(rebuild=False):
+    cached = load_json(MAP_FILE)
+    key = _map_key()
+    if not rebuild and cached.get("key") == key:
+        return cached["scenarios"], False
+    scenarios = _build_step_map()
+    save_json(MAP_FILE, {"key": key, "ts": time.time(), "scenarios": scenarios})
+    return scenarios, True
+
+
+# ---------------- Selection ----------------
+
+def dependency_map(scenarios):
+    """{scenario_key: set(files)}"""
+    attrs = app_attributes()
+    deps = {}
+    for key, info in scenarios.items():
+        files = {info["feature"]}
+        for path, line in info["step_defs"]:
+            files |= closure([path])
+            used = app_attrs_used(path, line)
+            if used:
+                files |= closure([_posix(APPLICATION)])
+                files |= closure([attrs[a] for a in used if a in attrs])
+        deps[key] = files
+    return deps
+
+
+def changed_files(green):
+    current = tree_hashes()
+    previous = green.get("files", {})
+    return {f for f in set(current) | set(previous) if current.get(f) != previous.get(f)}
+
+
+def select(scenarios, deps, green):
+    """(selected scenario keys, reason)"""
+    if not green.get("files"):
+        return sorted(scenarios), "no green baseline"
+    changed = changed_files(green)
+    if not changed:
+        return [], "no changes since last green run"
+    # Page objects reach scenarios through context.app, which is tracked per
+    # step function, so don't treat everything application.py imports as global
+    global_deps = closure([_posix(ENVIRONMENT)] + provider_modules(), stop={_posix(APPLICATION)})
+    hit = changed & global_deps
+    if hit:
+        return sorted(scenarios), f"shared hooks changed ({', '.join(sorted(hit)[:3])})"
+    picked = sorted(k for k in scenarios if deps[k] & changed)
+    return picked, f"{len(changed)} changed file(s): {', '.join(sorted(changed)[:5])}"
+
+
+def mark_green(hashes=None):
+    save_json(GREEN_FILE, {"ts": time.time(), "files": hashes or tree_hashes()})
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    if "--mark-green" in args:
+        mark_green()
+        print("Current tree recorded as green.")
+        return 0
+    list_only = "--list" in args
+    run_all = "--all" in args
+    args = [a for a in args if a not in ("--list", "--all")]
+
+    started = time.perf_counter()
+    scenarios, rebuilt = step_map()
+    deps = dependency_map(scenarios)
+    if run_all:
+        selected, reason = sorted(scenarios), "--all"
+    else:
+        selected, reason = select(scenarios, deps, load_json(GREEN_FILE))
+    print(f"Selection: {len(selected)}/{len(scenarios)} scenarios — {reason} "
+          f"(map {'rebuilt' if rebuilt else 'cached'}, {time.perf_counter() - started:.2f}s)")
+    for key in selected:
+        print(f"  {scenarios[key]['location']}  {key.split('::', 1)[1]}")
+    if list_only or not selected:
+        return 0
+
+    # Hash before running: edits made during the run must not count as green
+    hashes = tree_hashes()
+    locations = [scenarios[k]["location"] for k in selected]
+    code = subprocess.call([sys.executable, "-m", "behave", *args, *locations])
+    # A tag/name filter may have skipped affected scenarios: don't call that green
+    filtered = any(a.split("=", 1)[0] in ("-t", "--tags", "-n", "--name") for a in args)
+    if code == 0 and not filtered:
+        mark_green(hashes)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
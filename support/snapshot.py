@@ -0,0 +1,55 @@
+"""
+One-round-trip page state.
+
+page_snapshot() returns URL, title, document.readyState, the HTTP status of
+the last navigation (Navigation Timing `responseStatus`, null where the
+browser doesn't expose it), which landmark CSS selectors are present, and
+which text signs (e.g. "404") occur in the body — all from a single
+execute_script. Body text is searched in the page, never shipped back.
+"""
+
+SNAPSHOT_JS = """
+var landmarks = arguments[0] || [], signs = arguments[1] || [];
+var nav = null;
+try { nav = performance.getEntriesByType('navigation')[0] || null; } catch (e) {}
+var present = [];
+for (var i = 0; i < landmarks.length; i++) {
+  try { if (document.querySelector(landmarks[i])) present.push(landmarks[i]); } catch (e) {}
+}
+var hits = [];
+if (signs.length && document.body) {
+  var text = (document.body.innerText || '').toLowerCase();
+  for (var j = 0; j < signs.length; j++) {
+    if (text.indexOf(signs[j].toLowerCase()) !== -1) hits.push(signs[j]);
+  }
+}
+return {
+  url: location.href,
+  title: document.title || '',
+  readyState: document.readyState,
+  status: (nav && nav.responseStatus) ? nav.responseStatus : null,
+  landmarks: present,
+  text_hits: hits
+};
+"""
+
+
+def page_snapshot(driver, landmarks=(), text_signs=()):
+    if getattr(driver, "http_tier", False):
+        # support.http_driver.HttpDriver answers from the HTTP response
+        return driver.snapshot(landmarks, text_signs)
+    try:
+        snap = driver.execute_script(SNAPSHOT_JS, list(landmarks), list(text_signs))
+        if isinstance(snap, dict):
+            return snap
+    except Exception:
+        pass
+    # Script execution unavailable (e.g. page mid-navigation): plain commands
+    return {
+        "url": driver.current_url or "",
+        "title": driver.title or "",
+        "readyState": None,
+        "status": None,
+        "landmarks": [],
+        "text_hits": [],
+    }
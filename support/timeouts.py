@@ -0,0 +1,114 @@
+"""
+Adaptive, history-driven timeouts.
+
+Waits are keyed by (provider/browser/device profile, page, condition). Each
+successful wait records how long it took; once a key has enough samples the
+timeout becomes max(P95_MULTIPLE * p95, P99_MULTIPLE * p99), clamped to
+[FLOOR, CEILING]. Until then — or after repeated timeouts, which suggest the
+learned value is too tight — the caller's hardcoded default is used.
+
+Waits on the @http tier's HttpDriver are not recorded (see learns_from).
+
+State lives in .behave_cache/timeouts.json and is written in after_all.
+Disable with -D adaptive_timeouts=false (samples are still recorded).
+"""
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.cache import load_json, save_json
+
+TIMEOUTS_FILE = "timeouts.json"
+MIN_SAMPLES = 8
+MAX_SAMPLES = 200
+P95_MULTIPLE = 3.0
+P99_MULTIPLE = 2.0
+FLOOR = 2.0     # seconds
+CEILING = 120.0
+MAX_MISSES = 2  # consecutive timeouts before falling back to the default
+
+_lock = threading.Lock()
+_state = {"profile": "default", "enabled": True, "data": None, "dirty": set()}
+
+
+def configure(profile="default", enabled=True):
+    with _lock:
+        _state.update(profile=profile or "default", enabled=enabled, data=None, dirty=set())
+
+
+def _key(page, condition):
+    return f"{_state['profile']}|{page}|{condition}"
+
+
+def _data():
+    if _state["data"] is None:
+        _state["data"] = load_json(TIMEOUTS_FILE)
+    return _state["data"]
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def timeout_for(page, condition, default):
+    """Learned timeout for this wait, or `default` while history is thin."""
+    if not _state["enabled"]:
+        return default
+    with _lock:
+        entry = _data().get(_key(page, condition)) or {}
+    samples = sorted(entry.get("samples", []))
+    if len(samples) < MIN_SAMPLES or entry.get("misses", 0) >= MAX_MISSES:
+        return default
+    learned = max(P95_MULTIPLE * _percentile(samples, 95), P99_MULTIPLE * _percentile(samples, 99))
+    return round(min(CEILING, max(FLOOR, learned)), 2)
+
+
+def record(page, condition, seconds, ok):
+    with _lock:
+        key = _key(page, condition)
+        entry = _data().setdefault(key, {"samples": [], "misses": 0})
+        if ok:
+            entry["samples"] = (entry["samples"] + [round(seconds, 3)])[-MAX_SAMPLES:]
+            entry["misses"] = 0
+        else:
+            entry["misses"] = int(entry.get("misses", 0)) + 1
+        entry["ts"] = time.time()
+        _state["dirty"].add(key)
+
+
+def learns_from(driver) -> bool:
+    """HTTP-tier waits finish in milliseconds; learning from them would starve browser runs."""
+    return not getattr(driver, "http_tier", False)
+
+
+def until(driver, page, condition, method, default, poll=0.5):
+    """WebDriverWait(driver, adaptive timeout).until(method), recording the outcome."""
+    timeout = timeout_for(page, condition, default)
+    learn = learns_from(driver)
+    started = time.monotonic()
+    try:
+        value = WebDriverWait(driver, timeout, poll_frequency=poll).until(method)
+    except TimeoutException:
+        if learn:
+            record(page, condition, time.monotonic() - started, False)
+        raise
+    if learn:
+        record(page, condition, time.monotonic() - started, True)
+    return value
+
+
+def flush():
+    """Merge this process's updated keys into the file (parallel workers share it)."""
+    with _lock:
+        if not _state["dirty"] or _state["data"] is None:
+            return
+        on_disk = load_json(TIMEOUTS_FILE)
+        for key in _state["dirty"]:
+            on_disk[key] = _state["data"][key]
+        save_json(TIMEOUTS_FILE, on_disk)
+        _state["dirty"] = set()
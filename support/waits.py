@@ -0,0 +1,232 @@
+"""
+Single-deadline "any-of" waits.
+
+The old helpers tried fallback locators one after another, each with its own
+full timeout, so 4 candidates at 15s could take 60s. wait_any() checks every
+candidate on each poll under ONE deadline and returns the first hit together
+with the candidate that won. Worst case is now `timeout`, not N * timeout.
+
+A candidate is either a locator tuple `(By.X, "selector")` or a callable
+`predicate(driver)` whose truthy return value counts as a match (used for
+URL/title signals next to element locators).
+
+Passing `key=(page, field)` probes candidates in the order learned by
+support.locator_stats, treats `timeout` as the cold-start default for
+support.timeouts, and records the outcome for the next run.
+
+Wait mode "event" (-D wait_mode=event) replaces client-side polling with one
+execute_async_script that watches the DOM (MutationObserver + load event) and
+resolves the moment a candidate matches. Predicates, locators the page can't
+evaluate, or a driver that rejects the script fall back to polling.
+
+When polling, candidate lists that are all CSS-expressible are gated by one
+combined `a, b, c` query (see support.js_locators.combined_css), so a miss
+costs a single round trip instead of one per candidate.
+"""
+import time
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support import instrumentation, locator_stats, timeouts
+from support.js_locators import FIND_JS, SUPPORTED, combined_css
+
+POLL_FREQUENCY = 0.25
+CONDITIONS = ("present", "visible", "clickable")
+WAIT_MODES = ("poll", "event")
+
+_mode = {"value": "poll"}
+
+# arguments: cands, condition, [urlFragments], timeoutMs, callback
+EVENT_WAIT_JS = FIND_JS + r"""
+var cands = arguments[0], cond = arguments[1], urlParts = arguments[2];
+var timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+function check() {
+  if (urlParts && urlParts.length) {
+    var href = location.href;
+    for (var u = 0; u < urlParts.length; u++) if (href.indexOf(urlParts[u]) === -1) return null;
+    return {url: href};
+  }
+  for (var i = 0; i < cands.length; i++) {
+    var el = __find(cands[i], cond !== 'present');
+    if (el && (cond !== 'clickable' || !el.disabled)) return {el: el, index: i};
+  }
+  return null;
+}
+var first = check();
+if (first) { done(first); return; }
+var finished = false, obs = null, iv = null, timer = null;
+function finish(v) {
+  if (finished) return;
+  finished = true;
+  if (obs) obs.disconnect();
+  clearInterval(iv); clearTimeout(timer);
+  window.removeEventListener('load', onEvent);
+  window.removeEventListener('hashchange', onEvent);
+  window.removeEventListener('popstate', onEvent);
+  done(v);
+}
+function onEvent() { var h = check(); if (h) finish(h); }
+obs = new MutationObserver(onEvent);
+obs.observe(document, {childList: true, subtree: true, attributes: true});
+window.addEventListener('load', onEvent);
+window.addEventListener('hashchange', onEvent);
+window.addEventListener('popstate', onEvent);
+// Style-only visibility changes don't always mutate the DOM: cheap in-page tick
+iv = setInterval(onEvent, 100);
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+
+def set_mode(mode):
+    if mode not in WAIT_MODES:
+        raise ValueError(f"Unknown wait mode {mode!r}; expected one of {WAIT_MODES}")
+    _mode["value"] = mode
+
+
+def get_mode():
+    return _mode["value"]
+
+
+def _match_locator(driver, locator, condition):
+    # find_elements returns immediately (no implicit wait), so a dead
+    # candidate costs one round trip per poll instead of a full timeout.
+    for el in driver.find_elements(*locator):
+        if condition == "present":
+            return el
+        try:
+            if el.is_displayed() and (condition != "clickable" or el.is_enabled()):
+                return el
+        except StaleElementReferenceException:
+            continue
+    return None
+
+
+def probe_any(driver, candidates, condition="visible"):
+    """One poll over all candidates: (match, candidate) or None."""
+    for cand in candidates:
+        try:
+            if callable(cand):
+                hit = cand(driver)
+                hit = hit if hit else None
+            else:
+                hit = _match_locator(driver, cand, condition)
+        except StaleElementReferenceException:
+            hit = None
+        if hit is not None:
+            return hit, cand
+    return None
+
+
+# ---------------- Strategies ----------------
+
+def _event_capable(candidates):
+    return all(not callable(c) and c[0] in SUPPORTED for c in candidates)
+
+
+def _run_event_script(driver, cands, condition, url_parts, timeout):
+    """Result dict, or None on in-page timeout; WebDriverException if unusable."""
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = None
+    driver.set_script_timeout(timeout + 2)
+    try:
+        return driver.execute_async_script(EVENT_WAIT_JS, cands, condition, url_parts, int(timeout * 1000))
+    finally:
+        # The script timeout is session-wide; other execute_async_script callers keep theirs
+        if previous is not None:
+            try:
+                driver.set_script_timeout(previous)
+            except WebDriverException:
+                pass
+
+
+def _poll_wait(driver, candidates, condition, timeout, poll):
+    # All-CSS candidate lists get one combined query per poll; the per-candidate
+    # probe (which decides the winner) only runs once something is in the DOM.
+    combined = combined_css(candidates)
+
+    def poll_once(d):
+        if combined and not d.find_elements(By.CSS_SELECTOR, combined):
+            return False
+        return probe_any(d, candidates, condition) or False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(poll_once)
+    except TimeoutException:
+        return None
+
+
+def _find_any(driver, candidates, condition, timeout, poll):
+    if _mode["value"] == "event" and _event_capable(candidates):
+        started = time.monotonic()
+        try:
+            hit = _run_event_script(driver, [list(c) for c in candidates], condition, [], timeout)
+            found = (hit["el"], candidates[int(hit["index"])]) if hit else None
+            # One execute_async_script to WebDriver: record it as the wait it is
+            instrumentation.event_wait(time.monotonic() - started, found is not None,
+                                       found[1] if found else candidates[0])
+            return found
+        except WebDriverException:
+            # Unsupported driver, or a navigation tore the script down: poll the rest
+            timeout = max(0.0, timeout - (time.monotonic() - started))
+    return _poll_wait(driver, candidates, condition, timeout, poll)
+
+
+# ---------------- Public API ----------------
+
+def wait_any(driver, candidates, condition="visible", timeout=10, poll=POLL_FREQUENCY, key=None):
+    """Return (element_or_value, winning_candidate); TimeoutException on deadline."""
+    if condition not in CONDITIONS:
+        raise ValueError(f"Unknown condition {condition!r}; expected one of {CONDITIONS}")
+    candidates = list(candidates)
+    learn = key and timeouts.learns_from(driver)
+    if key:
+        candidates = locator_stats.rank(*key, candidates)
+        page, field = key
+        timeout = timeouts.timeout_for(page, f"{field}:{condition}", timeout)
+    started = time.monotonic()
+    hit = _find_any(driver, candidates, condition, timeout, poll)
+    if learn:
+        elapsed = time.monotonic() - started
+        locator_stats.record(page, field, candidates, hit[1] if hit else None, elapsed)
+        timeouts.record(page, f"{field}:{condition}", elapsed, hit is not None)
+    if hit is None:
+        raise TimeoutException(f"No candidate became {condition} within {timeout}s: {candidates}")
+    return hit
+
+
+def wait_url(driver, fragments, timeout=10, poll=POLL_FREQUENCY, key=None):
+    """Wait until the current URL contains every fragment; returns the URL."""
+    fragments = list(fragments)
+    if key:
+        page, field = key
+        timeout = timeouts.timeout_for(page, f"{field}:url", timeout)
+    started = time.monotonic()
+    url = None
+    if _mode["value"] == "event":
+        try:
+            hit = _run_event_script(driver, [], "present", fragments, timeout)
+            url = hit["url"] if hit else ""
+            instrumentation.event_wait(time.monotonic() - started, bool(url))
+        except WebDriverException:
+            pass
+    if url is None:
+        remaining = max(0.0, timeout - (time.monotonic() - started))
+        try:
+            url = WebDriverWait(driver, remaining, poll_frequency=poll).until(
+                lambda d: d.current_url if all(f in (d.current_url or "") for f in fragments) else False
+            )
+        except TimeoutException:
+            url = ""
+    if key and timeouts.learns_from(driver):
+        timeouts.record(page, f"{field}:url", time.monotonic() - started, bool(url))
+    if not url:
+        raise TimeoutException(f"URL did not contain {fragments} within {timeout}s")
+    return url
@@ -0,0 +1,252 @@
+"""
+Warm browser pool.
+
+A long-lived local daemon keeps K browser sessions launched and idle. behave
+runs with `-D provider=warm` check one out and attach to it through
+webdriver.Remote, so they skip the driver install, driver spawn and cold
+browser launch. When the run ends the session is checked back in; the daemon
+resets it (cookies, storage, extra windows) and parks it for the next run.
+
+    # terminal 1
+    python -m support.warm_pool serve --browser chrome --size 2 --headless
+
+    # terminal 2
+    python -m behave -D provider=warm -f pretty
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+
+DEFAULT_PORT = 4455
+DEFAULT_URL = f"http://127.0.0.1:{DEFAULT_PORT}"
+
+RESET_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+# ---------------- Client side (used from before_all / after_all) ----------------
+
+def _call(base_url, path, payload=None, timeout=120):
+    data = json.dumps(payload or {}).encode("utf-8")
+    req = urllib.request.Request(
+        f"{base_url.rstrip('/')}{path}", data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode("utf-8") or "{}")
+
+
+def checkout(base_url=DEFAULT_URL, browser="chrome"):
+    """Lease an idle session: {"session_id", "executor_url", "capabilities", "browser"}."""
+    return _call(base_url, "/checkout", {"browser": browser})
+
+
+def checkin(lease, base_url=DEFAULT_URL):
+    try:
+        _call(base_url, "/checkin", {"session_id": lease["session_id"]}, timeout=30)
+    except Exception:
+        pass
+
+
+class _AttachedRemote(webdriver.Remote):
+    """webdriver.Remote that adopts an existing session instead of creating one."""
+
+    def __init__(self, lease):
+        self._lease = lease
+        if lease.get("browser") == "firefox":
+            options = webdriver.FirefoxOptions()
+        else:
+            options = webdriver.ChromeOptions()
+        super().__init__(command_executor=lease["executor_url"], options=options)
+
+    def start_session(self, *args, **kwargs):
+        self.session_id = self._lease["session_id"]
+        self.caps = self._lease.get("capabilities") or {}
+
+
+def attach(lease):
+    return _AttachedRemote(lease)
+
+
+# ---------------- Daemon side ----------------
+
+class WarmPool:
+    def __init__(self, browser="chrome", size=2, headless=False, max_size=None):
+        self.browser = browser
+        self.size = size
+        self.max_size = max_size or size * 2
+        self.headless = headless
+        self.lock = threading.Lock()
+        self.fill_lock = threading.Lock()
+        self.idle = []     # drivers ready to lease
+        self.leased = {}   # session_id -> driver
+
+    def _launch(self):
+        from support.browsers import local_chrome_options, local_firefox_options
+        from support.driver_paths import resolve_driver_path
+
+        if self.browser == "firefox":
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            service = FirefoxService(resolve_driver_path("firefox"))
+            return webdriver.Firefox(service=service, options=local_firefox_options(self.headless))
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        service = ChromeService(resolve_driver_path("chrome"))
+        return webdriver.Chrome(service=service, options=local_chrome_options(self.headless))
+
+    def fill(self):
+        with self.fill_lock:
+            while len(self.idle) + len(self.leased) < self.size:
+                drv = self._launch()
+                with self.lock:
+                    self.idle.append(drv)
+
+    def lease(self):
+        with self.lock:
+            drv = self.idle.pop() if self.idle else None
+            total = len(self.idle) + len(self.leased)
+        if drv is None:
+            if total >= self.max_size:
+                raise RuntimeError("warm pool exhausted")
+            drv = self._launch()
+        with self.lock:
+            self.leased[drv.session_id] = drv
+        threading.Thread(target=self.fill, daemon=True).start()
+        return {
+            "session_id": drv.session_id,
+            "executor_url": drv.service.service_url,
+            "capabilities": drv.caps,
+            "browser": self.browser,
+        }
+
+    def release(self, session_id):
+        with self.lock:
+            drv = self.leased.pop(session_id, None)
+        if drv is None:
+            return
+        try:
+            self._reset(drv)
+        except Exception:
+            # Session is broken (crashed tab, killed browser): replace it.
+            try:
+                drv.quit()
+            except Exception:
+                pass
+            self.fill()
+            return
+        with self.lock:
+            self.idle.append(drv)
+
+    @staticmethod
+    def _reset(drv):
+        handles = drv.window_handles
+        for h in handles[1:]:
+            drv.switch_to.window(h)
+            drv.close()
+        drv.switch_to.window(handles[0])
+        drv.execute_script(RESET_SCRIPT)
+        drv.delete_all_cookies()
+        drv.get("about:blank")
+
+    def status(self):
+        with self.lock:
+            return {"browser": self.browser, "idle": len(self.idle), "leased": len(self.leased)}
+
+    def shutdown(self):
+        with self.lock:
+            drivers = self.idle + list(self.leased.values())
+            self.idle, self.leased = [], {}
+        for drv in drivers:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+
+
+def _handler_for(pool):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, body):
+            raw = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def do_GET(self):
+            if self.path == "/status":
+                return self._send(200, pool.status())
+            self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except Exception:
+                payload = {}
+            try:
+                if self.path == "/checkout":
+                    wanted = (payload.get("browser") or pool.browser).lower()
+                    if wanted != pool.browser:
+                        return self._send(409, {"error": f"pool serves {pool.browser}, not {wanted}"})
+                    return self._send(200, pool.lease())
+                if self.path == "/checkin":
+                    pool.release(payload.get("session_id"))
+                    return self._send(200, {"ok": True})
+            except Exception as e:
+                return self._send(503, {"error": str(e)})
+            self._send(404, {"error": "not found"})
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def serve(browser="chrome", size=2, headless=False, port=DEFAULT_PORT):
+    pool = WarmPool(browser=browser, size=size, headless=headless)
+    pool.fill()
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(pool))
+
+    def _stop(*_):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    print(f"Warm pool: {size} x {browser} ready on http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m support.warm_pool")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("serve", help="run the warm session daemon")
+    s.add_argument("--browser", default=os.getenv("BROWSER", "chrome"), choices=["chrome", "firefox"])
+    s.add_argument("--size", type=int, default=2)
+    s.add_argument("--headless", action="store_true")
+    s.add_argument("--port", type=int, default=DEFAULT_PORT)
+    st = sub.add_parser("status", help="show idle/leased sessions")
+    st.add_argument("--url", default=DEFAULT_URL)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        serve(args.browser, args.size, args.headless, args.port)
+    else:
+        with urllib.request.urlopen(f"{args.url}/status", timeout=5) as resp:
+            print(resp.read().decode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())